@@ -6,21 +6,42 @@ from pathlib import Path
 import click
 import yaml as yaml_lib
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib json module
+    orjson = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml_lib, "CSafeLoader", yaml_lib.SafeLoader)
+
+
+def _load_json(f):
+    """Parse JSON from a binary file object."""
+    if orjson is None:
+        return json.load(f)
+    raw = f.read()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN/Infinity and integers wider than 64 bits; json accepts them
+        return json.loads(raw)
+
 
 def load_yaml_or_json(file_path: Path) -> dict:
     """Load YAML or JSON file and validate it's a dictionary."""
-    with open(file_path) as f:
+    with open(file_path, "rb") as f:
         if file_path.suffix.lower() in [".yaml", ".yml"]:
-            data = yaml_lib.safe_load(f)
+            data = yaml_lib.load(f, Loader=_SafeLoader)
         elif file_path.suffix.lower() == ".json":
-            data = json.load(f)
+            data = _load_json(f)
         else:
             try:
                 f.seek(0)
-                data = yaml_lib.safe_load(f)
+                data = yaml_lib.load(f, Loader=_SafeLoader)
             except yaml_lib.YAMLError:
                 f.seek(0)
-                data = json.load(f)
+                data = _load_json(f)
 
     if data is None:
         raise ValueError(f"File {file_path} contains no data")
@@ -77,8 +98,12 @@ def analyze(input_file: Path, output: Path | None, max_depth: int | None):
             return obj
 
         serializable_analysis = make_json_serializable(analysis)
-        with open(output, "w") as f:
-            json.dump(serializable_analysis, f, indent=2)
+        if orjson is not None:
+            with open(output, "wb") as f:
+                f.write(orjson.dumps(serializable_analysis, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output, "w") as f:
+                json.dump(serializable_analysis, f, indent=2)
         click.echo(f"\n✓ Analysis saved to: {output}")
 
 
@@ -442,7 +467,8 @@ def compare_yaml(
         click.echo("  Mode: Schema comparison only")
     click.echo()
 
-    comparator = YAMLComparator(output_dir=db_dir)
+    # The CLI runs from a script entry point, so large files may use worker processes
+    comparator = YAMLComparator(output_dir=db_dir, parallel=True)
 
     try:
         if data:
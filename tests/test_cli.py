@@ -1,5 +1,9 @@
 """Tests for Schema Sentinel CLI."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 
@@ -158,6 +162,33 @@ def test_yaml_tables(runner, sample_yaml):
     assert "Generating tables" in result.output
 
 
+def test_yaml_tables_json_with_nan_and_big_integers(runner, tmp_path):
+    """Test that JSON the json module accepts (NaN, Infinity, integers beyond 64 bits) loads with orjson installed."""
+    json_file = tmp_path / "nan.json"
+    json_file.write_text(
+        '{"items": [{"id": 1, "v": NaN}, {"id": 2, "v": Infinity}], "big": 123456789012345678901234567890}'
+    )
+
+    result = runner.invoke(main, ["yaml", "tables", str(json_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "ITEMS" in result.output
+
+
+def test_yaml_shredder_cli_json_with_nan_and_big_integers(tmp_path):
+    """Test that yaml_shredder_cli.py loads the same JSON without a traceback."""
+    json_file = tmp_path / "nan.json"
+    json_file.write_text(
+        '{"items": [{"id": 1, "v": NaN}, {"id": 2, "v": Infinity}], "big": 123456789012345678901234567890}'
+    )
+    cli = Path(__file__).parent.parent / "yaml_shredder_cli.py"
+
+    result = subprocess.run([sys.executable, str(cli), "tables", str(json_file)], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "ITEMS" in result.stdout
+
+
 def test_yaml_tables_with_output(runner, sample_yaml, tmp_path):
     """Test yaml tables with output directory."""
     output_dir = tmp_path / "tables"
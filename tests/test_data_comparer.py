@@ -148,6 +148,18 @@ class TestDataComparer:
         assert result["rows_modified"] == 0
         assert result["rows_unchanged"] == 3
 
+    def test_compare_identical_tables_matches_full_scan(self, monkeypatch):
+        """Test that skipping the per-key scan for identical tables gives the full-scan result."""
+        comparer = DataComparer()
+        df1 = pd.DataFrame({"id": [1, 2, 2, 3], "name": ["a", None, "b", "c"], "value": [1.5, float("nan"), 2.0, 3.0]})
+
+        fast = comparer.compare_tables(df1, df1.copy(), primary_key=["id"], table_name="test")
+        monkeypatch.setattr(pd.DataFrame, "equals", lambda self, other: False)
+        full = comparer.compare_tables(df1, df1.copy(), primary_key=["id"], table_name="test")
+
+        assert fast == full
+        assert fast["rows_unchanged"] == 3
+
     def test_compare_with_added_rows(self):
         """Test comparison when second table has additional rows."""
         comparer = DataComparer()
@@ -198,6 +210,20 @@ class TestDataComparer:
         for diff in result["field_differences"]:
             assert diff["field"] == "value"
 
+    def test_compare_with_modified_rows_uses_first_row_per_key(self):
+        """Test that modified rows compare the first row per key and treat missing values as equal."""
+        comparer = DataComparer()
+        df1 = pd.DataFrame({"id": [1, 2, 2, 3], "name": ["a", "b", "x", None], "value": [1.0, None, 5.0, 3.0]})
+        df2 = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None], "value": [1.0, None, 4.0]})
+
+        result = comparer.compare_tables(df1, df2, primary_key=["id"], table_name="test")
+
+        assert result["rows_modified"] == 1
+        assert result["rows_unchanged"] == 2
+        assert result["modified_rows"] == [
+            {"primary_key": {"id": 3}, "differences": {"value": {"old": 3.0, "new": 4.0}}}
+        ]
+
     def test_compare_with_explicit_primary_key(self):
         """Test comparison with explicitly specified primary key."""
         comparer = DataComparer()
@@ -383,3 +409,125 @@ class TestYAMLComparatorDataIntegration:
         assert "# YAML Comparison Report" in schema_report
         assert "summary" in data_comparison
         assert report_path.exists()
+
+    def test_compare_yaml_files_full_builds_data_report_once(
+        self, sample_yaml_files_for_data_comparison, tmp_path, monkeypatch
+    ):
+        """Test that the data report file and the combined report share one generated data report."""
+        from schema_sentinel.yaml_comparator import YAMLComparator
+
+        reports = []
+        original_report = DataComparer.generate_comparison_report
+        monkeypatch.setattr(
+            DataComparer,
+            "generate_comparison_report",
+            lambda self, comparison: reports.append(original_report(self, comparison)) or reports[-1],
+        )
+
+        yaml1, yaml2 = sample_yaml_files_for_data_comparison
+        comparator = YAMLComparator(output_dir=tmp_path / "dbs")
+        report_path = tmp_path / "full_report.md"
+        schema_report, _ = comparator.compare_yaml_files_full(yaml1, yaml2, output_report=report_path)
+
+        assert len(reports) == 1
+        assert (tmp_path / "full_report.data.md").read_text() == reports[0]
+        assert report_path.read_text() == schema_report + "\n\n---\n\n" + reports[0]
+
+    def test_compare_yaml_files_full_processes_each_file_once(
+        self, sample_yaml_files_for_data_comparison, tmp_path, monkeypatch
+    ):
+        """Test that schema and data comparison share one parse and one table generation per file."""
+        import yaml
+
+        from schema_sentinel.yaml_comparator import YAMLComparator
+        from yaml_shredder.table_generator import TableGenerator
+
+        parsed = []
+        generated = []
+        original_load = yaml.load
+        original_safe_load = yaml.safe_load
+        original_generate = TableGenerator.generate_tables
+        monkeypatch.setattr(yaml, "load", lambda stream, Loader: parsed.append(1) or original_load(stream, Loader))
+        monkeypatch.setattr(yaml, "safe_load", lambda stream: parsed.append(1) or original_safe_load(stream))
+        monkeypatch.setattr(
+            TableGenerator,
+            "generate_tables",
+            lambda self, *args, **kwargs: generated.append(1) or original_generate(self, *args, **kwargs),
+        )
+
+        yaml1, yaml2 = sample_yaml_files_for_data_comparison
+        comparator = YAMLComparator(output_dir=tmp_path / "dbs")
+        comparator.compare_yaml_files_full(yaml1, yaml2)
+
+        assert len(parsed) == 2
+        assert len(generated) == 2
+
+    def test_compare_data_parallel_matches_serial(self, sample_yaml_files_for_data_comparison, tmp_path, monkeypatch):
+        """Test that generating tables in worker processes gives the same comparison."""
+        from schema_sentinel.yaml_comparator import YAMLComparator
+        from yaml_shredder import yaml_comparator as yaml_comparator_module
+
+        yaml1, yaml2 = sample_yaml_files_for_data_comparison
+        comparator = YAMLComparator(output_dir=tmp_path / "dbs")
+        serial = comparator.compare_data(yaml1, yaml2)
+
+        monkeypatch.setattr(yaml_comparator_module, "_PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(yaml_comparator_module.os, "cpu_count", lambda: 2)
+        parallel = YAMLComparator(output_dir=tmp_path / "dbs", parallel=True).compare_data(yaml1, yaml2)
+
+        assert parallel["summary"] == serial["summary"]
+        assert len(parallel["table_comparisons"]) == len(serial["table_comparisons"])
+
+    def test_compare_data_identical_files_processed_once(
+        self, sample_yaml_files_for_data_comparison, tmp_path, monkeypatch
+    ):
+        """Test that byte-identical files are parsed once and, with the same name, flattened once."""
+        import yaml
+
+        from schema_sentinel.yaml_comparator import YAMLComparator
+        from yaml_shredder.table_generator import TableGenerator
+
+        yaml1, _ = sample_yaml_files_for_data_comparison
+        copy_dir = tmp_path / "copy"
+        copy_dir.mkdir()
+        same_name = copy_dir / yaml1.name
+        other_name = copy_dir / "renamed.yaml"
+        same_name.write_bytes(yaml1.read_bytes())
+        other_name.write_bytes(yaml1.read_bytes())
+
+        comparator = YAMLComparator(output_dir=tmp_path / "dbs")
+        expected = comparator.compare_data(yaml1, other_name, data2=yaml.safe_load(other_name.read_text()))
+
+        parsed = []
+        generated = []
+        original_load = yaml.load
+        original_generate = TableGenerator.generate_tables
+        monkeypatch.setattr(yaml, "load", lambda stream, Loader: parsed.append(1) or original_load(stream, Loader))
+        monkeypatch.setattr(
+            TableGenerator,
+            "generate_tables",
+            lambda self, *args, **kwargs: generated.append(1) or original_generate(self, *args, **kwargs),
+        )
+
+        result = comparator.compare_data(yaml1, same_name)
+        assert (len(parsed), len(generated)) == (1, 1)
+        assert result["summary"]["tables_with_differences"] == 0
+
+        parsed.clear()
+        generated.clear()
+        result = comparator.compare_data(yaml1, other_name)
+        assert (len(parsed), len(generated)) == (1, 2)
+        assert result["summary"] == expected["summary"]
+
+    def test_compare_data_missing_file(self, sample_yaml_files_for_data_comparison, tmp_path):
+        """Test that a missing input file is reported with the YAML file path."""
+        from schema_sentinel.yaml_comparator import YAMLComparator
+
+        yaml1, _ = sample_yaml_files_for_data_comparison
+        missing = tmp_path / "missing.yaml"
+        comparator = YAMLComparator(output_dir=tmp_path / "dbs")
+
+        with pytest.raises(FileNotFoundError, match=f"YAML file not found: {missing}"):
+            comparator.compare_data(yaml1, missing)
+        with pytest.raises(FileNotFoundError, match=f"YAML file not found: {missing}"):
+            comparator.compare_yaml_files_full(missing, yaml1)
@@ -0,0 +1,79 @@
+"""Tests for SQLiteLoader - loading generated tables into SQLite."""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from yaml_shredder.data_loader import SQLiteLoader
+
+
+@pytest.fixture
+def tables():
+    """Sample tables with mixed column types and missing values."""
+    return {
+        "SERVICES": pd.DataFrame(
+            {
+                "id": [1, 2],
+                "name": ["api", None],
+                "ratio": [0.5, float("nan")],
+                "enabled": [True, False],
+                "created": pd.to_datetime(["2024-01-02 03:04:05", None]),
+            }
+        ),
+        "SERVICES_ports": pd.DataFrame({"port": [80, 443], "parent_id": [1, 1], "_row_index": [0, 1]}),
+    }
+
+
+def _dump(db_path):
+    """Return schema objects and rows of every table in a database."""
+    with sqlite3.connect(db_path) as conn:
+        objects = conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name").fetchall()
+        rows = {
+            name: conn.execute(f'SELECT * FROM "{name}"').fetchall() for kind, name, _ in objects if kind == "table"
+        }
+    conn.close()
+    return objects, rows
+
+
+def test_single_transaction_matches_per_table_load(tmp_path, tables):
+    """Test that loading in one transaction creates the same tables, indexes and rows as to_sql."""
+    per_table = tmp_path / "per_table.db"
+    single = tmp_path / "single.db"
+
+    with SQLiteLoader(per_table) as loader:
+        loader.load_tables(tables)
+    with SQLiteLoader(single) as loader:
+        loader.load_tables(tables, single_transaction=True)
+        assert loader.loaded_tables == ["SERVICES", "SERVICES_ports"]
+        assert not loader.connection.in_transaction
+
+    assert _dump(single) == _dump(per_table)
+    assert _dump(single)[1]["SERVICES"] == [(1, "api", 0.5, 1, "2024-01-02 03:04:05"), (2, None, None, 0, None)]
+
+
+def test_single_transaction_append_matches_columns_by_name(tmp_path, tables):
+    """Test that appending to an existing table with another column order fills columns by name."""
+    db_path = tmp_path / "data.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('CREATE TABLE "SERVICES_ports" (_row_index INTEGER, parent_id INTEGER, port INTEGER)')
+    conn.close()
+
+    with SQLiteLoader(db_path) as loader:
+        loader.load_tables({"SERVICES_ports": tables["SERVICES_ports"]}, if_exists="append", single_transaction=True)
+
+    assert _dump(db_path)[1]["SERVICES_ports"] == [(0, 1, 80), (1, 1, 443)]
+
+
+def test_single_transaction_rolls_back_on_error(tmp_path, tables):
+    """Test that a failing table leaves none of the batch behind."""
+    db_path = tmp_path / "data.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('CREATE TABLE "SERVICES_ports" (port INTEGER)')
+    conn.close()
+
+    with SQLiteLoader(db_path) as loader:
+        with pytest.raises(ValueError, match="already exists"):
+            loader.load_tables(tables, if_exists="fail", single_transaction=True)
+
+    assert [name for _, name, _ in _dump(db_path)[0]] == ["SERVICES_ports"]
@@ -1,8 +1,10 @@
 """Tests for markdown document generator."""
 
 import pytest
+import yaml
 
 from yaml_shredder.doc_generator import MarkdownDocGenerator, generate_doc_from_yaml
+from yaml_shredder.table_generator import TableGenerator
 
 
 @pytest.fixture
@@ -116,12 +118,13 @@ def test_get_table_schema(sample_db):
     doc_gen.disconnect()
 
 
-def test_generate_markdown(sample_db, tmp_path):
+def test_generate_markdown(sample_db, tmp_path, capsys):
     """Test markdown generation."""
     doc_gen = MarkdownDocGenerator(sample_db)
     output_path = tmp_path / "output.md"
 
     markdown = doc_gen.generate_markdown(output_path=output_path)
+    assert f"✓ Markdown documentation saved to: {output_path}" in capsys.readouterr().out
 
     # Check markdown content
     assert "# Database Documentation:" in markdown or "# test" in markdown.lower()
@@ -215,3 +218,46 @@ def test_generate_doc_from_yaml_with_max_depth(sample_yaml_file, tmp_path):
     assert output_path.exists()
     content = output_path.read_text()
     assert len(content) > 0
+
+
+def test_generate_doc_from_yaml_parses_like_safe_load(tmp_path, monkeypatch):
+    """Test that the libyaml loader hands the table generator the same data as yaml.safe_load."""
+    yaml_file = tmp_path / "types.yaml"
+    yaml_file.write_text("flag: yes\ncreated: 2024-01-02\nitems:\n  - {id: 0x1f, ratio: 1e3, note: ~}\n")
+    seen = []
+    generate_tables = TableGenerator.generate_tables
+
+    def record(self, data, *args, **kwargs):
+        seen.append(data)
+        return generate_tables(self, data, *args, **kwargs)
+
+    monkeypatch.setattr(TableGenerator, "generate_tables", record)
+    generate_doc_from_yaml(yaml_path=yaml_file, output_dir=tmp_path)
+
+    assert seen == [yaml.safe_load(yaml_file.read_text())]
+
+
+def test_dataframe_to_markdown_numeric_columns(sample_db):
+    """Test that numeric and boolean columns render exactly as str() of each cell did."""
+    import numpy as np
+    import pandas as pd
+
+    doc_gen = MarkdownDocGenerator(sample_db)
+    df = pd.DataFrame(
+        {
+            "i": np.array([1, -2, 3], dtype="int64"),
+            "f": [1.0, float("nan"), 1e20],
+            "small": [0.1, 1e-7, 123456789.125],
+            "b": [True, False, True],
+            "ni": pd.array([1, None, 3], dtype="Int64"),
+            "u": np.array([1, 2, 3], dtype="uint8"),
+        }
+    )
+
+    assert doc_gen._dataframe_to_markdown(df).splitlines() == [
+        "| i | f | small | b | ni | u |",
+        "| --- | --- | --- | --- | --- | --- |",
+        "| 1 | 1.0 | 0.1 | True | 1 | 1 |",
+        "| -2 | nan | 1e-07 | False | <NA> | 2 |",
+        "| 3 | 1e+20 | 123456789.125 | True | 3 | 3 |",
+    ]
@@ -0,0 +1,265 @@
+"""Tests for SchemaGenerator - JSON Schema generation from YAML/JSON files."""
+
+import json
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_shredder import schema_generator
+from yaml_shredder.schema_generator import SchemaGenerator, generate_schema_from_directory
+
+
+def test_add_yaml_file_multi_document(tmp_path):
+    """Test that every document of a multi-document YAML file is added to the schema."""
+    yaml_file = tmp_path / "multi.yaml"
+    yaml_file.write_text("name: app\nversion: 1\n---\nname: other\nregion: us-east-1\n")
+
+    generator = SchemaGenerator()
+    generator.add_yaml_file(yaml_file)
+    schema = generator.generate_schema()
+
+    assert set(schema["properties"]) == {"name", "version", "region"}
+    assert schema["required"] == ["name"]
+    assert generator.files_processed == [str(yaml_file)]
+
+
+@pytest.mark.parametrize("content", ["", "# only a comment\n"])
+def test_add_yaml_file_without_documents(tmp_path, monkeypatch, content):
+    """Test that a YAML file without documents adds one null example, serially and in worker processes."""
+    yaml_file = tmp_path / "empty.yaml"
+    yaml_file.write_text(content)
+
+    generator = SchemaGenerator()
+    generator.add_yaml_file(yaml_file)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    parallel = SchemaGenerator()
+    parallel.add_files([yaml_file] * 16, parallel=True)
+
+    assert generator.generate_schema() == {"$schema": "http://json-schema.org/schema#", "type": "null"}
+    assert parallel.generate_schema() == generator.generate_schema()
+
+
+def test_save_schema_round_trip(tmp_path):
+    """Test that a saved schema can be read back as JSON."""
+    json_file = tmp_path / "data.json"
+    json_file.write_text(json.dumps({"id": 1, "tags": ["a", "b"]}))
+
+    generator = SchemaGenerator()
+    generator.add_json_file(json_file)
+    output = tmp_path / "schema.json"
+    generator.save_schema(output)
+
+    saved = json.loads(output.read_text())
+    assert saved == generator.generate_schema()
+    assert saved["properties"]["id"]["type"] == "integer"
+
+
+def test_generate_schema_cached_until_new_example(monkeypatch):
+    """Test that the schema is built once between additions and each caller gets its own copy."""
+    generator = SchemaGenerator()
+    generator.add_object({"id": 1})
+
+    builds = []
+    original_to_schema = generator.builder.to_schema
+    monkeypatch.setattr(generator.builder, "to_schema", lambda: builds.append(1) or original_to_schema())
+
+    first = generator.generate_schema()
+    first["title"] = "changed"
+    first["properties"]["id"]["type"] = "string"
+    assert generator.generate_schema() == original_to_schema()
+    assert len(builds) == 1
+
+    generator.add_object({"id": 2, "name": "x"})
+    second = generator.generate_schema()
+
+    assert len(builds) == 2
+    assert set(second["properties"]) == {"id", "name"}
+
+
+def test_generate_schema_from_directory_parallel(tmp_path, capsys, monkeypatch):
+    """Test that large directories are parsed in parallel with the same result."""
+    for i in range(20):
+        sub_dir = tmp_path / f"group{i % 3}"
+        sub_dir.mkdir(exist_ok=True)
+        (sub_dir / f"file{i:02d}.yaml").write_text(f"id: {i}\nname: item{i}\n" + ("extra: true\n" if i == 7 else ""))
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    schema = generate_schema_from_directory(tmp_path, parallel=True)
+
+    assert set(schema["properties"]) == {"id", "name", "extra"}
+    assert sorted(schema["required"]) == ["id", "name"]
+    assert "Files processed: 20" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [("*.yaml", {"top", "sub", "deep"}), ("sub/*.yaml", {"sub"}), ("**/x/*.yaml", {"deep"})],
+)
+def test_generate_schema_from_directory_patterns_with_directories(tmp_path, pattern, expected):
+    """Test that patterns are matched recursively and may include directory components, like Path.rglob."""
+    (tmp_path / "sub" / "x").mkdir(parents=True)
+    (tmp_path / "top.yaml").write_text("top: 1\n")
+    (tmp_path / "sub" / "sub.yaml").write_text("sub: 1\n")
+    (tmp_path / "sub" / "x" / "deep.yaml").write_text("deep: 1\n")
+
+    schema = generate_schema_from_directory(tmp_path, pattern=pattern)
+
+    assert set(schema["properties"]) == expected
+
+
+def test_add_files_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that a large mixed batch parsed in worker processes matches serial adds in order."""
+    files = []
+    for i in range(20):
+        if i % 2:
+            file_path = tmp_path / f"file{i:02d}.json"
+            file_path.write_text(json.dumps({"id": i, "tags": ["a"]}))
+        else:
+            file_path = tmp_path / f"file{i:02d}.yaml"
+            file_path.write_text(f"id: {i}\ncreated: 2024-01-0{i % 9 + 1}\n")
+        files.append(file_path)
+
+    serial = SchemaGenerator()
+    for file_path in files:
+        if file_path.suffix == ".json":
+            serial.add_json_file(file_path)
+        else:
+            serial.add_yaml_file(file_path)
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    parallel = SchemaGenerator()
+    parallel.add_files(files, parallel=True)
+
+    assert parallel.files_processed == serial.files_processed
+    assert parallel.generate_schema() == serial.generate_schema()
+
+
+def test_add_files_serial_by_default(tmp_path, monkeypatch):
+    """Test that library callers get no worker processes unless they opt in, however many files they pass."""
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started without parallel=True")
+
+    for i in range(20):
+        (tmp_path / f"file{i:02d}.yaml").write_text(f"id: {i}\n")
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    monkeypatch.setattr(schema_generator, "ProcessPoolExecutor", no_pool)
+
+    generator = SchemaGenerator()
+    generator.add_files(sorted(tmp_path.iterdir()))
+    schema = generate_schema_from_directory(tmp_path)
+
+    assert len(generator.files_processed) == 20
+    assert schema == generator.generate_schema()
+
+
+def test_add_object_records_source(tmp_path):
+    """Test that an object parsed from a file matches adding the file itself."""
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("id: 1\ncreated: 2024-01-02\n")
+
+    from_file = SchemaGenerator()
+    from_file.add_yaml_file(yaml_file)
+    from_object = SchemaGenerator()
+    from_object.add_object({"id": 1, "created": date(2024, 1, 2)}, source=yaml_file)
+
+    assert from_object.generate_schema() == from_file.generate_schema()
+    assert from_object.get_stats() == from_file.get_stats()
+
+
+def test_add_yaml_file_matches_safe_load(tmp_path):
+    """Test that the libyaml loader resolves dates, YAML 1.1 booleans and nulls like yaml.safe_load_all."""
+    yaml_text = (
+        "id: 0x1f\nenabled: yes\ncreated: 2024-01-02\nat: 2024-01-02 03:04:05\nratio: 1e3\nnote: ~\n"
+        "tags: [on, off, '1.0']\n---\nid: 2\nenabled: no\nbase: &b {k: v}\nref: *b\n"
+    )
+    yaml_file = tmp_path / "types.yaml"
+    yaml_file.write_text(yaml_text)
+
+    from_file = SchemaGenerator()
+    from_file.add_yaml_file(yaml_file)
+    from_safe_load = SchemaGenerator()
+    for document in yaml.safe_load_all(yaml_text):
+        from_safe_load.add_object(document)
+
+    assert from_file.generate_schema() == from_safe_load.generate_schema()
+
+
+def _run_under_spawn(tmp_path, script):
+    """Run a Python script in a fresh interpreter whose multiprocessing start method is spawn."""
+    script_path = tmp_path / "script.py"
+    script_path.write_text("import multiprocessing\nmultiprocessing.set_start_method('spawn')\n" + script)
+    repo_root = Path(__file__).parent.parent
+    return subprocess.run(
+        [sys.executable, str(script_path)], cwd=repo_root, capture_output=True, text=True, timeout=120
+    )
+
+
+def test_library_call_without_main_guard_under_spawn(tmp_path):
+    """Test that a script with no __main__ guard can generate a schema for a large directory under spawn."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(20):
+        (data_dir / f"file{i:02d}.yaml").write_text(f"id: {i}\n")
+
+    result = _run_under_spawn(
+        tmp_path,
+        "import os, sys\n"
+        "sys.path.insert(0, os.getcwd())\n"
+        "os.cpu_count = lambda: 4\n"
+        "from yaml_shredder.schema_generator import generate_schema_from_directory\n"
+        f"generate_schema_from_directory({str(data_dir)!r})\n",
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Files processed: 20" in result.stdout
+
+
+def test_cli_schema_directory_in_worker_processes_under_spawn(tmp_path):
+    """Test that the CLI, which opts in to worker processes, parses a large directory under spawn."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(20):
+        (data_dir / f"file{i:02d}.yaml").write_text(f"id: {i}\nname: item{i}\n")
+    output = tmp_path / "schema.json"
+
+    result = _run_under_spawn(
+        tmp_path,
+        "import os, runpy, sys\n"
+        "if __name__ == '__main__':\n"
+        "    sys.path.insert(0, os.getcwd())\n"
+        "    os.cpu_count = lambda: 4\n"
+        f"    sys.argv = ['yaml_shredder_cli.py', 'schema', {str(data_dir)!r}, '-o', {str(output)!r}]\n"
+        "    runpy.run_path('yaml_shredder_cli.py', run_name='__main__')\n",
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Added 20 files" in result.stdout
+    schema = json.loads(output.read_text())
+    assert sorted(schema["required"]) == ["id", "name"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_add_json_file_accepts_nan_and_big_integers(tmp_path, monkeypatch, use_orjson):
+    """Test that JSON the json module accepts (NaN, Infinity, integers beyond 64 bits) is added with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(schema_generator, "orjson", None)
+    elif schema_generator.orjson is None:
+        pytest.skip("orjson is not installed")
+    json_file = tmp_path / "nan.json"
+    json_file.write_text('{"a": NaN, "b": Infinity, "c": 123456789012345678901234567890, "d": "x"}')
+
+    generator = SchemaGenerator()
+    generator.add_json_file(json_file)
+
+    assert generator.generate_schema()["properties"] == {
+        "a": {"type": "number"},
+        "b": {"type": "number"},
+        "c": {"type": "integer"},
+        "d": {"type": "string"},
+    }
+    assert schema_generator._parse_and_normalize(json_file, is_json=True)[0]["c"] == 123456789012345678901234567890
@@ -0,0 +1,98 @@
+"""Tests for StructureAnalyzer - array detection and table candidates."""
+
+import pytest
+
+from yaml_shredder.structure_analyzer import StructureAnalyzer
+
+
+@pytest.fixture
+def nested_array_data():
+    """Sample structure with nested arrays of objects."""
+    return {
+        "name": "MyApp",
+        "services": [
+            {"id": 1, "name": "api", "ports": [{"port": 80}, {"port": 443}]},
+            {"id": 2, "name": "worker", "ports": [{"port": 9000}]},
+        ],
+    }
+
+
+def test_path_to_table_name_strips_array_indices():
+    """Test that array indices and dots are removed from table names."""
+    analyzer = StructureAnalyzer()
+
+    assert analyzer._path_to_table_name("services") == "SERVICES"
+    assert analyzer._path_to_table_name("services[0].ports") == "SERVICES_PORTS"
+    assert analyzer._path_to_table_name("a.b[12].c") == "A_B_C"
+    assert analyzer._path_to_table_name("") == "UNKNOWN_TABLE"
+
+
+def test_path_to_table_name_keeps_baseline_names():
+    """Test that numeric keys are dropped and brackets around non-numeric keys are cleaned up."""
+    analyzer = StructureAnalyzer()
+
+    assert analyzer._path_to_table_name("years.2023") == "YEARS"
+    assert analyzer._path_to_table_name("years.2023.items") == "YEARS_ITEMS"
+    assert analyzer._path_to_table_name("2023") == "UNKNOWN_TABLE"
+    assert analyzer._path_to_table_name("a[b]") == "A_B"
+    assert analyzer._path_to_table_name("a[b].c[0]") == "A_B_C"
+    assert analyzer._path_to_table_name("a]b") == "AB"
+
+
+def test_table_candidates(nested_array_data):
+    """Test that object arrays are reported as table candidates."""
+    analyzer = StructureAnalyzer()
+    analyzer.analyze(nested_array_data)
+
+    candidates = analyzer.get_table_candidates()
+    table_names = [c["table_name"] for c in candidates]
+
+    assert table_names == ["SERVICES", "SERVICES_PORTS", "SERVICES_PORTS"]
+    assert candidates[0]["row_count"] == 2
+    assert candidates[0]["columns"] == ["id", "name", "ports"]
+
+
+def test_table_candidates_follow_arrays_found(nested_array_data):
+    """Test that candidates reflect the current arrays, including arrays not found by analyze()."""
+    analyzer = StructureAnalyzer()
+    analyzer.analyze(nested_array_data)
+    first = analyzer.get_table_candidates()
+    first.clear()
+
+    analyzer.analyze({"jobs": [{"id": 1}]})
+    assert [c["table_name"] for c in analyzer.get_table_candidates()][-1] == "JOBS"
+
+    # Same number of arrays, but a different list
+    replacement = dict(analyzer.arrays_found[0], path="teams[0].members")
+    analyzer.arrays_found = [replacement] + analyzer.arrays_found[1:]
+    candidates = analyzer.get_table_candidates()
+
+    assert len(candidates) == 4
+    assert candidates[0]["table_name"] == "TEAMS_MEMBERS"
+
+
+def test_analyze_result_has_only_public_keys(nested_array_data):
+    """Test that the analysis result carries no internal bookkeeping keys."""
+    analysis = StructureAnalyzer().analyze(nested_array_data)
+
+    assert set(analysis["arrays"][0]) == {
+        "path",
+        "length",
+        "type",
+        "element_types",
+        "common_keys",
+        "optional_keys",
+        "all_keys",
+        "structure_signature",
+        "is_homogeneous",
+    }
+
+
+def test_signature_cache_is_per_analyzer(nested_array_data):
+    """Test that interned signatures are reused within an analyzer but not shared between analyzers."""
+    first = StructureAnalyzer()
+    first.analyze(nested_array_data)
+
+    assert list(first.structure_patterns) == [("id", "name", "ports"), ("port",)]
+    assert first.structure_patterns[("port",)] == ["services[0].ports", "services[1].ports"]
+    assert StructureAnalyzer()._sig_cache == {}
@@ -0,0 +1,396 @@
+"""Tests for TableGenerator - table extraction and persistence."""
+
+import sys
+from collections import OrderedDict
+from datetime import date
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from yaml_shredder import table_generator
+from yaml_shredder.table_generator import TableGenerator
+
+
+@pytest.fixture
+def services_data():
+    """Sample structure with a root array of objects."""
+    return {
+        "name": "MyApp",
+        "services": [
+            {"id": 1, "name": "api", "port": 80},
+            {"id": 2, "name": "worker", "port": 9000},
+        ],
+    }
+
+
+# dtype name of all-string columns
+_STR = "object" if table_generator._STRING_DTYPE is None else str(table_generator._STRING_DTYPE)
+
+
+def _snapshot(tables):
+    """Reduce tables to (columns, dtype names, rows) with missing values as None, for exact comparison."""
+    return {
+        name: (
+            list(df.columns),
+            [str(dtype) for dtype in df.dtypes],
+            df.astype(object).where(df.notna(), None).values.tolist(),
+        )
+        for name, df in tables.items()
+    }
+
+
+def test_save_tables_defaults_to_parquet(tmp_path, services_data, capsys):
+    """Test that tables are written as parquet unless another format is requested."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(services_data, root_table_name="ROOT")
+    gen.save_tables(tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ROOT.parquet", "SERVICES.parquet"]
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "SERVICES.parquet"), tables["SERVICES"])
+
+    # Tables are written concurrently, but reported in table order
+    saved_lines = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0] for line in saved_lines] == ["Saved ROOT", "Saved SERVICES"]
+
+
+def test_save_tables_csv(tmp_path, services_data):
+    """Test that CSV output is still available on request."""
+    gen = TableGenerator()
+    gen.generate_tables(services_data, root_table_name="ROOT")
+    gen.save_tables(tmp_path, format="csv")
+
+    saved = pd.read_csv(tmp_path / "SERVICES.csv")
+    assert list(saved["name"]) == ["api", "worker"]
+
+
+def test_save_tables_parquet_batches_large_tables(tmp_path, monkeypatch):
+    """Test that tables above the batching threshold are split into row groups."""
+    monkeypatch.setattr(table_generator, "_PARQUET_BATCH_MIN_ROWS", 10)
+    monkeypatch.setattr(table_generator, "_PARQUET_ROW_GROUP_SIZE", 8)
+
+    gen = TableGenerator()
+    tables = gen.generate_tables({"items": [{"id": i, "label": f"item{i}"} for i in range(20)]})
+    gen.save_tables(tmp_path)
+
+    saved = tmp_path / "ITEMS.parquet"
+    assert pq.ParquetFile(saved).metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(saved), tables["ITEMS"])
+
+
+def test_array_tables_drop_duplicate_rows():
+    """Test that repeated array items are dropped unless an identifying column tells them apart."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {
+            "ports": [{"port": 80}, {"port": 443}, {"port": 80}],
+            "hosts": [{"id": 1, "zone": "a"}, {"id": 2, "zone": "a"}],
+        }
+    )
+
+    assert list(tables["PORTS"]["port"]) == [80, 443]
+    assert list(tables["PORTS"]["_row_index"]) == [0, 1]
+    assert list(tables["HOSTS"]["id"]) == [1, 2]
+
+
+def test_drop_duplicate_rows_with_null_identifying_key():
+    """Test that None and NaN in an identifying column still count as duplicates."""
+    df = pd.DataFrame({"id": [True, None, float("nan")], "v": [1, 2, 2]}, dtype=object)
+
+    result = table_generator._drop_duplicate_rows(df, ["id", "v"])
+
+    pd.testing.assert_frame_equal(result, df.drop_duplicates(subset=["id", "v"], keep="first"))
+    assert len(result) == 2
+
+
+def test_nested_arrays_get_only_their_own_parent_keys():
+    """Test that identifying keys of one item do not leak into tables of other items."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {
+            "items": [
+                {"id": 1, "subs": [{"id": 10, "leaf": [{"x": 1}]}], "tags": [{"t": "a"}]},
+                {"name": "b", "subs": [{"x": 2}]},
+            ]
+        }
+    )
+
+    assert list(tables["ITEMS_subs"].columns) == ["x", "parent_name", "_row_index"]
+    assert list(tables["ITEMS_subs_leaf"]["parent_id"]) == [10]
+    assert list(tables["ITEMS_tags"]["parent_id"]) == [1]
+    assert gen.relationships[-1] == {
+        "parent_table": "ITEMS",
+        "child_table": "ITEMS_subs",
+        "foreign_keys": ["name"],
+    }
+
+
+def test_array_table_dtypes():
+    """Test that column dtypes match pandas inference, including padded and mixed columns."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {
+            "items": [
+                {"id": 1, "ratio": 0.5, "enabled": True, "label": "a", "size": 1, "kind": "x"},
+                {"id": 2, "ratio": 1.5, "enabled": False, "label": 3, "kind": "y"},
+            ]
+        }
+    )
+
+    dtypes = tables["ITEMS"].dtypes
+    assert dtypes["id"] == "int64"
+    assert dtypes["ratio"] == "float64"
+    assert dtypes["enabled"] == "bool"
+    assert dtypes["label"] == "object"
+    assert dtypes["size"] == "float64"
+    assert dtypes["kind"] == (table_generator._STRING_DTYPE or object)
+
+
+def test_deeply_nested_arrays_are_found():
+    """Test that arrays nested deeper than the recursion limit still become tables."""
+    depth = sys.getrecursionlimit() + 100
+    data = {"root": {}}
+    node = data["root"]
+    for _ in range(depth):
+        node["child"] = {}
+        node = node["child"]
+    node["items"] = [{"id": 1}, {"id": 2}]
+    data["after"] = [{"id": 3}]
+
+    gen = TableGenerator()
+    tables = gen.generate_tables(data)
+
+    deep_name = "ROOT_" + "CHILD_" * depth + "ITEMS"
+    assert list(tables)[-2:] == [deep_name, "AFTER"]
+    assert list(tables[deep_name]["id"]) == [1, 2]
+
+
+def test_reset_between_files(services_data):
+    """Test that reset starts a new batch without touching previously returned tables."""
+    gen = TableGenerator()
+    first = gen.generate_tables(services_data, root_table_name="ROOT")
+
+    gen.reset()
+    second = gen.generate_tables({"jobs": [{"id": 1}]}, root_table_name="ROOT")
+
+    assert list(first) == ["ROOT", "SERVICES"]
+    assert list(second) == ["JOBS"]
+    assert gen.relationships == []
+
+
+def test_dict_and_list_subclasses_are_walked():
+    """Test that dict subclasses (e.g. OrderedDict) are flattened and searched for arrays like plain dicts."""
+    data = {
+        "items": [
+            OrderedDict(id=1, meta=OrderedDict(a=1, b=OrderedDict(c=2)), tags=[1, 2]),
+            {"id": 2, "meta": {"a": 3}, "tags": []},
+        ],
+        "cfg": OrderedDict(x=1, arr=[OrderedDict(id=5, sub=[{"q": 1}])]),
+    }
+
+    gen = TableGenerator()
+    tables = gen.generate_tables(data)
+
+    assert _snapshot(tables) == {
+        "CFG": (["x"], ["int64"], [[1]]),
+        "ITEMS": (
+            ["id", "meta_a", "meta_b_c", "tags", "_row_index"],
+            ["int64", "int64", "float64", _STR, "int64"],
+            [[1, 1, 2.0, "1, 2", 0], [2, 3, None, None, 1]],
+        ),
+        "CFG_ARR": (["id", "_row_index"], ["int64", "int64"], [[5, 0]]),
+        "CFG_ARR_sub": (["q", "parent_id", "_row_index"], ["int64", "int64", "int64"], [[1, 5, 0]]),
+    }
+    assert gen.relationships == [{"parent_table": "CFG_ARR", "child_table": "CFG_ARR_sub", "foreign_keys": ["id"]}]
+
+
+def test_array_table_columns_with_missing_keys():
+    """Test that columns follow first-seen order and keys missing from some items are padded as before."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {"items": [{"a": 1, "b": "x", "f": True}, {"b": "y", "c": 2.5}, {"a": 3, "f": False, "d": None}]}
+    )
+
+    assert _snapshot(tables) == {
+        "ITEMS": (
+            ["a", "b", "f", "_row_index", "c", "d"],
+            ["float64", _STR, "object", "int64", "float64", "float64"],
+            [[1.0, "x", True, 0, None, None], [None, "y", None, 1, 2.5, None], [3.0, None, False, 2, None, None]],
+        )
+    }
+
+
+def test_deep_nesting_respects_max_depth():
+    """Test that deep dicts in array items flatten fully, or to JSON strings at max_depth, in key order."""
+    data = {"rows": [{"a": {"b": {"c": {"d": {"e": 1}}}, "z": 2}, "k": "v"}, {"k": "w", "a": {"z": 3}}]}
+
+    assert _snapshot(TableGenerator().generate_tables(data)) == {
+        "ROWS": (
+            ["a_b_c_d_e", "a_z", "k", "_row_index"],
+            ["float64", "int64", _STR, "int64"],
+            [[1.0, 2, "v", 0], [None, 3, "w", 1]],
+        )
+    }
+    assert _snapshot(TableGenerator(max_depth=2).generate_tables(data)) == {
+        "ROWS": (
+            ["a_b", "a_z", "k", "_row_index"],
+            [_STR, "int64", _STR, "int64"],
+            [['{"c": {"d": {"e": 1}}}', 2, "v", 0], [None, 3, "w", 1]],
+        )
+    }
+
+
+def test_max_depth_serializes_nested_dicts_as_json():
+    """Test that dicts cut off by max_depth keep their JSON form, with str() for dates and string int keys."""
+    gen = TableGenerator(max_depth=1)
+    tables = gen.generate_tables({"rows": [{"meta": {"when": date(2024, 1, 2), 1: "one", "x.y": {"n": [1, 2]}}}]})
+
+    assert _snapshot(tables) == {
+        "ROWS": (
+            ["meta", "_row_index"],
+            [_STR, "int64"],
+            [['{"when": "2024-01-02", "1": "one", "x.y": {"n": [1, 2]}}', 0]],
+        )
+    }
+
+
+def test_flattened_column_names_with_int_and_dotted_keys():
+    """Test that int and dotted keys at nested levels produce the same column names as before."""
+    gen = TableGenerator()
+    tables = gen.generate_tables({"rows": [{"m": {1: {"x.y": 5, 2: "t"}, "tags": ["a", "b"], "empty": []}}]})
+
+    assert _snapshot(tables) == {
+        "ROWS": (
+            ["m_1_x.y", "m_1_2", "m_tags", "_row_index"],
+            ["int64", _STR, _STR, "int64"],
+            [[5, "t", "a, b", 0]],
+        )
+    }
+
+
+def test_root_split_table_order():
+    """Test that root scalars, dicts and arrays (including arrays inside root dicts) keep their table order."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {
+            "name": "x",
+            "first": [{"a": 1}],
+            "cfg": {"inner": [{"b": 2}], "v": 1},
+            "tags": [1, 2],
+            "empty": [],
+            "last": [{"c": 3}],
+            "n": 5,
+        }
+    )
+
+    assert _snapshot(tables) == {
+        "ROOT": (["name", "n"], [_STR, "int64"], [["x", 5]]),
+        "CFG": (["v"], ["int64"], [[1]]),
+        "FIRST": (["a", "_row_index"], ["int64", "int64"], [[1, 0]]),
+        "CFG_INNER": (["b", "_row_index"], ["int64", "int64"], [[2, 0]]),
+        "LAST": (["c", "_row_index"], ["int64", "int64"], [[3, 0]]),
+    }
+    assert list(tables) == ["ROOT", "CFG", "FIRST", "CFG_INNER", "LAST"]
+
+
+def test_mixed_flat_and_nested_items():
+    """Test that flat items, copied as-is, and nested items, flattened, share one column order."""
+    gen = TableGenerator()
+    tables = gen.generate_tables({"rows": [{"x": 1, "y": 2}, {"y": 3, "n": {"p": 4}, "x": 5}, {"q": 6}]})
+
+    assert _snapshot(tables) == {
+        "ROWS": (
+            ["x", "y", "_row_index", "n_p", "q"],
+            ["float64", "float64", "int64", "float64", "float64"],
+            [[1.0, 2.0, 0, None, None], [5.0, 3.0, 1, 4.0, None], [None, None, 2, None, 6.0]],
+        )
+    }
+
+
+def test_parent_key_and_row_index_override_item_keys():
+    """Test that parent keys and _row_index replace same-named item keys, keeping the first item's column order."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {
+            "groups": [
+                {
+                    "id": 7,
+                    "members": [{"user": "u0"}, {"parent_id": 99, "_row_index": 5, "user": "u1"}],
+                    "owners": [{"parent_id": 1, "user": "u2", "_row_index": 9}],
+                }
+            ]
+        }
+    )
+
+    assert _snapshot(tables) == {
+        "GROUPS": (["id", "_row_index"], ["int64", "int64"], [[7, 0]]),
+        "GROUPS_members": (
+            ["user", "parent_id", "_row_index"],
+            [_STR, "int64", "int64"],
+            [["u0", 7, 0], ["u1", 7, 1]],
+        ),
+        "GROUPS_owners": (["parent_id", "user", "_row_index"], ["int64", _STR, "int64"], [[7, "u2", 0]]),
+    }
+
+
+def test_flatten_dict_with_parent_key():
+    """Test _flatten_dict with a parent key and start depth: prefixes, JSON cut-off, joined and dropped lists."""
+    gen = TableGenerator(max_depth=2)
+
+    assert gen._flatten_dict({"a": {"b": {"c": 1}}, "d": [1, "x"], "e": [], "f": [{"g": 1}]}, parent_key="p") == {
+        "p_a_b": '{"c": 1}',
+        "p_d": "1, x",
+    }
+    assert gen._flatten_dict({"a": {"b": 1}}, parent_key="p", depth=1) == {"p_a": '{"b": 1}'}
+
+
+def test_path_to_table_name():
+    """Test that dots and underscores both become underscores, with empty segments kept."""
+    gen = TableGenerator()
+
+    assert [gen._path_to_table_name(p) for p in ["a.b_c.d", "x_y", "a..b", "Mixed.Case_path"]] == [
+        "A_B_C_D",
+        "X_Y",
+        "A__B",
+        "MIXED_CASE_PATH",
+    ]
+
+
+def test_table_names_are_stable_across_generators():
+    """Test that cached table names are the same for repeated paths, across instances and resets."""
+    data = {"cfg": {"inner.x": [{"b": 1}]}, "jobs": [{"id": 1}]}
+
+    first = TableGenerator()
+    names = list(first.generate_tables(data))
+    first.reset()
+
+    assert names == ["CFG_INNER_X", "JOBS"]
+    assert list(first.generate_tables(data)) == names
+    assert list(TableGenerator().generate_tables(data)) == names
+
+
+def test_nested_arrays_across_items_sharing_a_child_table():
+    """Test nested arrays under items with and without identifying keys, where later items replace the child table."""
+    gen = TableGenerator()
+    tables = gen.generate_tables(
+        {
+            "outer": [
+                {"name": "n1", "kids": [{"v": 1}]},
+                {"code": "c2", "kids": [{"v": 2}, {"v": 3}]},
+                {"other": 1, "kids": [{"v": 4}]},
+            ],
+            "nulls": [{"id": None, "kids": [{"v": 1}]}, {"id": 2, "name": "nm", "kids": [{"v": 2}]}],
+        }
+    )
+
+    assert _snapshot(tables) == {
+        "OUTER": (
+            ["name", "_row_index", "code", "other"],
+            [_STR, "int64", _STR, "float64"],
+            [["n1", 0, None, None], [None, 1, "c2", None], [None, 2, None, 1.0]],
+        ),
+        "OUTER_kids": (["v", "_row_index"], ["int64", "int64"], [[4, 0]]),
+        "NULLS": (["id", "_row_index", "name"], ["float64", "int64", _STR], [[None, 0, None], [2.0, 1, "nm"]]),
+        "NULLS_kids": (["v", "parent_id", "_row_index"], ["int64", "int64", "int64"], [[2, 2, 0]]),
+    }
+    assert [rel["foreign_keys"] for rel in gen.relationships] == [["name"], ["code"], ["id"], ["id"]]
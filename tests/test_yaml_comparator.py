@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from schema_sentinel.yaml_comparator import YAMLComparator
+from yaml_shredder import yaml_comparator as yaml_comparator_module
 
 
 @pytest.fixture
@@ -222,11 +223,40 @@ def test_compare_yaml_files_keep_dbs(sample_yaml_files, temp_dir, tmp_path):
     assert db2_path.exists()
 
 
+def test_compare_yaml_files_parallel_matches_serial(sample_yaml_files, temp_dir, monkeypatch):
+    """Test that generating tables in worker processes gives the same report."""
+    yaml1, yaml2 = sample_yaml_files
+    comparator = YAMLComparator(output_dir=temp_dir)
+    serial = comparator.compare_yaml_files(yaml1, yaml2)
+
+    monkeypatch.setattr(yaml_comparator_module, "_PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(yaml_comparator_module.os, "cpu_count", lambda: 2)
+
+    assert YAMLComparator(output_dir=temp_dir, parallel=True).compare_yaml_files(yaml1, yaml2) == serial
+
+
+def test_compare_yaml_files_serial_by_default(sample_yaml_files, temp_dir, monkeypatch):
+    """Test that library callers get no worker processes unless they opt in, whatever the input size."""
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started without parallel=True")
+
+    monkeypatch.setattr(yaml_comparator_module, "_PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(yaml_comparator_module.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(yaml_comparator_module, "ProcessPoolExecutor", no_pool)
+    yaml1, yaml2 = sample_yaml_files
+    comparator = YAMLComparator(output_dir=temp_dir)
+
+    assert "Comparison" in comparator.compare_yaml_files(yaml1, yaml2)
+    comparator.compare_data(yaml1, yaml2)
+    comparator.compare_yaml_files_full(yaml1, yaml2)
+
+
 def test_missing_yaml_file(temp_dir):
     """Test error handling for missing YAML file."""
     comparator = YAMLComparator(output_dir=temp_dir)
 
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="YAML file not found: nonexistent.yaml"):
         comparator.load_yaml_to_db(Path("nonexistent.yaml"))
 
 
@@ -301,3 +331,117 @@ CO_005-MPM:
     assert "db1_name" in comparison
     assert "db2_name" in comparison
     assert "common_tables" in comparison
+
+
+def test_get_row_counts_batches_many_tables(temp_dir, monkeypatch):
+    """Test that row counts are fetched correctly when tables span several count queries."""
+    monkeypatch.setattr(yaml_comparator_module, "_COUNT_BATCH_SIZE", 2)
+    temp_dir.mkdir(parents=True)
+    db_path = temp_dir / "many.db"
+    with sqlite3.connect(db_path) as conn:
+        for i in range(5):
+            conn.execute(f'CREATE TABLE "T{i}" (x INTEGER)')
+            conn.executemany(f'INSERT INTO "T{i}" VALUES (?)', [(n,) for n in range(i)])
+    conn.close()
+
+    comparator = YAMLComparator(output_dir=temp_dir)
+
+    assert comparator.get_row_counts(db_path) == {"T0": 0, "T1": 1, "T2": 2, "T3": 3, "T4": 4}
+
+
+def test_metadata_queries_open_database_read_only(temp_dir):
+    """Test that metadata queries work on paths with URI special characters and do not write."""
+    temp_dir.mkdir(parents=True)
+    db_path = temp_dir / "my db #1?.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('CREATE TABLE "ITEMS" (id INTEGER, name TEXT)')
+        conn.execute("INSERT INTO ITEMS VALUES (1, 'a')")
+    conn.close()
+
+    conn = yaml_comparator_module._open_sqlite_readonly(db_path)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM ITEMS")
+    finally:
+        conn.close()
+
+    comparator = YAMLComparator(output_dir=temp_dir)
+    assert comparator.get_row_counts(db_path) == {"ITEMS": 1}
+    assert list(comparator.get_table_info(db_path)["ITEMS"]["name"]) == ["id", "name"]
+
+
+def test_compare_databases_duckdb(sample_yaml_files, temp_dir):
+    """Test schema and row count comparison on DuckDB databases."""
+    yaml1, yaml2 = sample_yaml_files
+    comparator = YAMLComparator(output_dir=temp_dir, use_duckdb=True)
+
+    db1_path = comparator.load_yaml_to_db(yaml1, root_table_name="deployment")
+    db2_path = comparator.load_yaml_to_db(yaml2, root_table_name="deployment")
+
+    table_info = comparator.get_table_info(db1_path)
+    assert list(table_info["DEPLOYMENT_SERVERS"].columns) == ["name", "type"]
+    assert "ip" in table_info["DEPLOYMENT_SERVERS"]["name"].tolist()
+
+    comparison = comparator.compare_databases(db1_path, db2_path)
+    assert comparison["common_tables"] == sorted(set(table_info) & set(comparator.get_table_info(db2_path)))
+    assert comparator.get_row_counts(db1_path)["DEPLOYMENT_SERVERS"] == 2
+
+
+def test_compare_databases_reports_type_mismatches(temp_dir):
+    """Test that a column whose type changed is reported as a type mismatch, not as two columns."""
+    temp_dir.mkdir(parents=True)
+    db1_path = temp_dir / "first.db"
+    db2_path = temp_dir / "second.db"
+    with sqlite3.connect(db1_path) as conn:
+        conn.execute('CREATE TABLE "ITEMS" (id INTEGER, port INTEGER, old TEXT)')
+    conn.close()
+    with sqlite3.connect(db2_path) as conn:
+        conn.execute('CREATE TABLE "ITEMS" (id INTEGER, port TEXT, new TEXT)')
+    conn.close()
+
+    comparator = YAMLComparator(output_dir=temp_dir)
+    comparison = comparator.compare_databases(db1_path, db2_path)
+
+    assert comparison["schema_differences"]["ITEMS"] == {
+        "columns_only_in_db1": [("old", "TEXT")],
+        "columns_only_in_db2": [("new", "TEXT")],
+        "type_mismatches": [("port", "INTEGER", "TEXT")],
+    }
+    assert "- `port` (INTEGER in File 1, TEXT in File 2)" in comparator.generate_report(comparison)
+
+
+def test_generate_report_without_type_mismatches_key(temp_dir):
+    """Test that comparisons built without a type_mismatches entry still produce a report."""
+    comparator = YAMLComparator(output_dir=temp_dir)
+    comparison = yaml_comparator_module._compare_metadata(
+        "first", "second", {"A": [("id", "INTEGER")]}, {"A": 1}, {"A": [("name", "TEXT")]}, {"A": 1}
+    )
+    del comparison["schema_differences"]["A"]["type_mismatches"]
+
+    report = comparator.generate_report(comparison)
+
+    assert "- `name` (TEXT)" in report
+    assert "different types" not in report
+
+
+def test_generate_report_replaces_file_atomically(temp_dir, tmp_path, monkeypatch):
+    """Test that a failed report write leaves the previous report intact and no temporary file."""
+    comparator = YAMLComparator(output_dir=temp_dir)
+    columns = {"A": [("id", "INTEGER")]}
+    comparison = yaml_comparator_module._compare_metadata("first", "second", columns, {"A": 1}, columns, {"A": 2})
+    report_path = tmp_path / "reports" / "report.md"
+
+    report = comparator.generate_report(comparison, output_path=report_path)
+    assert report_path.read_text() == report
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(yaml_comparator_module.os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        comparator.generate_report(
+            yaml_comparator_module._compare_metadata("first", "second", {}, {}, {}, {}), output_path=report_path
+        )
+
+    assert report_path.read_text() == report
+    assert [p.name for p in report_path.parent.iterdir()] == ["report.md"]
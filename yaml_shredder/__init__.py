@@ -1,13 +1,17 @@
 """YAML Shredder - Automatic schema generation and tabular structure extraction from YAML/JSON files."""
 
-from yaml_shredder.data_comparer import DataComparer, PrimaryKeyDetector, TableMatcher
-from yaml_shredder.data_loader import DuckDBLoader, SQLiteLoader, load_to_duckdb, load_to_sqlite
-from yaml_shredder.ddl_generator import DDLGenerator
-from yaml_shredder.doc_generator import MarkdownDocGenerator, generate_doc_from_yaml
-from yaml_shredder.schema_generator import SchemaGenerator
-from yaml_shredder.structure_analyzer import StructureAnalyzer
-from yaml_shredder.table_generator import TableGenerator
-from yaml_shredder.yaml_comparator import YAMLComparator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from yaml_shredder.data_comparer import DataComparer, PrimaryKeyDetector, TableMatcher
+    from yaml_shredder.data_loader import DuckDBLoader, SQLiteLoader, load_to_duckdb, load_to_sqlite
+    from yaml_shredder.ddl_generator import DDLGenerator
+    from yaml_shredder.doc_generator import MarkdownDocGenerator, generate_doc_from_yaml
+    from yaml_shredder.schema_generator import SchemaGenerator
+    from yaml_shredder.structure_analyzer import StructureAnalyzer
+    from yaml_shredder.table_generator import TableGenerator
+    from yaml_shredder.yaml_comparator import YAMLComparator
 
 __version__ = "0.1.0"
 
@@ -27,3 +31,37 @@ __all__ = [
     "load_to_duckdb",
     "load_to_sqlite",
 ]
+
+# Public name -> defining submodule. Submodules are imported on first access so that
+# importing one of them (e.g. from the CLI) does not pull in pandas, pyarrow and duckdb.
+_EXPORTS = {
+    "DataComparer": "data_comparer",
+    "PrimaryKeyDetector": "data_comparer",
+    "TableMatcher": "data_comparer",
+    "DuckDBLoader": "data_loader",
+    "SQLiteLoader": "data_loader",
+    "load_to_duckdb": "data_loader",
+    "load_to_sqlite": "data_loader",
+    "DDLGenerator": "ddl_generator",
+    "MarkdownDocGenerator": "doc_generator",
+    "generate_doc_from_yaml": "doc_generator",
+    "SchemaGenerator": "schema_generator",
+    "StructureAnalyzer": "structure_analyzer",
+    "TableGenerator": "table_generator",
+    "YAMLComparator": "yaml_comparator",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List module attributes including the lazily imported public names."""
+    return sorted(set(globals()) | set(__all__))
@@ -8,11 +8,48 @@ import re
 from difflib import SequenceMatcher
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 log = logging.getLogger(__name__)
 
 
+def _first_row_positions(key_values: pd.Series) -> dict[tuple, int]:
+    """Map each primary key tuple to the position of the first row that has it.
+
+    Args:
+        key_values: Primary key tuple of every row
+
+    Returns:
+        Dictionary of key tuple -> row position
+    """
+    positions = {}
+    for position, key in enumerate(key_values.tolist()):
+        positions.setdefault(key, position)
+    return positions
+
+
+def _changed_rows(rows1: pd.DataFrame, rows2: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """Flag aligned row pairs that differ in any of the given columns.
+
+    Values that are missing in both rows count as equal.
+
+    Args:
+        rows1: Rows from the first table
+        rows2: Rows from the second table, aligned by position with rows1
+        columns: Columns to compare
+
+    Returns:
+        Boolean array, True where the row pair differs
+    """
+    changed = np.zeros(len(rows1), dtype=bool)
+    for col in columns:
+        values1 = rows1[col].to_numpy(dtype=object)
+        values2 = rows2[col].to_numpy(dtype=object)
+        changed |= ~(pd.isna(values1) & pd.isna(values2)) & (values1 != values2)
+    return changed
+
+
 class PrimaryKeyDetector:
     """Detect primary keys in table data."""
 
@@ -363,8 +400,10 @@ class DataComparer:
         common_columns = list(set(df1.columns) & set(df2.columns))
 
         # Get keys from both DataFrames
-        df1_keys = set(df1[primary_key].apply(tuple, axis=1))
-        df2_keys = set(df2[primary_key].apply(tuple, axis=1))
+        df1_key_values = df1[primary_key].apply(tuple, axis=1)
+        df2_key_values = df2[primary_key].apply(tuple, axis=1)
+        df1_keys = set(df1_key_values)
+        df2_keys = set(df2_key_values)
 
         # Identify added, removed, and common keys
         only_in_first = df1_keys - df2_keys
@@ -372,58 +411,68 @@ class DataComparer:
         common_keys = df1_keys & df2_keys
 
         # Get rows only in first
-        rows_only_in_first = df1[df1[primary_key].apply(tuple, axis=1).isin(only_in_first)]
+        rows_only_in_first = df1[df1_key_values.isin(only_in_first)]
 
         # Get rows only in second
-        rows_only_in_second = df2[df2[primary_key].apply(tuple, axis=1).isin(only_in_second)]
+        rows_only_in_second = df2[df2_key_values.isin(only_in_second)]
 
         # Compare common rows
         modified_rows = []
         field_differences = []
 
-        for key_tuple in common_keys:
-            # Create filter condition
-            filter1 = pd.Series([True] * len(df1))
-            filter2 = pd.Series([True] * len(df2))
-
-            for i, col in enumerate(primary_key):
-                filter1 = filter1 & (df1[col] == key_tuple[i])
-                filter2 = filter2 & (df2[col] == key_tuple[i])
-
-            row1 = df1[filter1].iloc[0] if filter1.any() else None
-            row2 = df2[filter2].iloc[0] if filter2.any() else None
-
-            if row1 is not None and row2 is not None:
-                # Compare values in common columns
-                differences = {}
-                for col in common_columns:
-                    if col in primary_key:
-                        continue
-                    val1 = row1[col]
-                    val2 = row2[col]
+        # Rows of identical tables cannot differ, so only compare tables that are not
+        changed_rows = []
+        if not (df1.empty or df2.empty or df1.equals(df2)):
+            # Keys with missing values never select a row, as NaN does not equal itself
+            keys = [key for key in common_keys if not any(pd.isna(value) for value in key)]
+            positions1 = _first_row_positions(df1_key_values)
+            positions2 = _first_row_positions(df2_key_values)
+
+            # Compare the first row for each key column by column instead of filtering both tables per key
+            value_columns = [col for col in common_columns if col not in primary_key]
+            rows1 = df1.iloc[[positions1[key] for key in keys]]
+            rows2 = df2.iloc[[positions2[key] for key in keys]]
+            changed = _changed_rows(rows1, rows2, value_columns)
+            changed_rows = [
+                (key, positions1[key], positions2[key])
+                for key, row_changed in zip(keys, changed, strict=True)
+                if row_changed
+            ]
+
+        for key_tuple, position1, position2 in changed_rows:
+            row1 = df1.iloc[position1]
+            row2 = df2.iloc[position2]
+
+            # Compare values in common columns
+            differences = {}
+            for col in common_columns:
+                if col in primary_key:
+                    continue
+                val1 = row1[col]
+                val2 = row2[col]
 
-                    # Handle NaN comparison
-                    if pd.isna(val1) and pd.isna(val2):
-                        continue
-                    if val1 != val2:
-                        differences[col] = {"old": val1, "new": val2}
+                # Handle NaN comparison
+                if pd.isna(val1) and pd.isna(val2):
+                    continue
+                if val1 != val2:
+                    differences[col] = {"old": val1, "new": val2}
 
-                if differences:
-                    modified_rows.append(
+            if differences:
+                modified_rows.append(
+                    {
+                        "primary_key": dict(zip(primary_key, key_tuple, strict=True)),
+                        "differences": differences,
+                    }
+                )
+                for col, diff in differences.items():
+                    field_differences.append(
                         {
                             "primary_key": dict(zip(primary_key, key_tuple, strict=True)),
-                            "differences": differences,
+                            "field": col,
+                            "old_value": diff["old"],
+                            "new_value": diff["new"],
                         }
                     )
-                    for col, diff in differences.items():
-                        field_differences.append(
-                            {
-                                "primary_key": dict(zip(primary_key, key_tuple, strict=True)),
-                                "field": col,
-                                "old_value": diff["old"],
-                                "new_value": diff["new"],
-                            }
-                        )
 
         return {
             "table_name": table_name,
@@ -40,6 +40,7 @@ class SQLiteLoader:
         tables: dict[str, pd.DataFrame],
         if_exists: str = "replace",
         create_indexes: bool = True,
+        single_transaction: bool = False,
     ) -> None:
         """
         Load multiple tables into SQLite.
@@ -48,21 +49,85 @@ class SQLiteLoader:
             tables: Dictionary of table_name -> DataFrame
             if_exists: How to behave if table exists ('fail', 'replace', 'append')
             create_indexes: Whether to create indexes on foreign key columns
+            single_transaction: Whether to write all tables and indexes in one transaction
+                instead of committing after every table
         """
         if not self.connection:
             self.connect()
 
         self.loaded_tables = []
 
-        for table_name, df in tables.items():
-            self._load_table(table_name, df, if_exists)
-            self.loaded_tables.append(table_name)
+        if single_transaction:
+            self._load_tables_in_transaction(tables, if_exists, create_indexes)
+        else:
+            for table_name, df in tables.items():
+                self._load_table(table_name, df, if_exists)
+                self.loaded_tables.append(table_name)
 
-            if create_indexes:
-                self._create_indexes(table_name, df)
+                if create_indexes:
+                    self._create_indexes(table_name, df)
 
         print(f"\n✓ Loaded {len(tables)} tables into {self.db_path}")
 
+    def _load_tables_in_transaction(
+        self, tables: dict[str, pd.DataFrame], if_exists: str = "replace", create_indexes: bool = True
+    ) -> None:
+        """
+        Load multiple tables into SQLite with a single commit.
+
+        pandas' to_sql commits after every table, so rows are inserted directly
+        with executemany. Tables, column types and row values come from pandas'
+        SQLiteTable, so they match those written by _load_table.
+
+        Args:
+            tables: Dictionary of table_name -> DataFrame
+            if_exists: How to behave if table exists ('fail', 'replace', 'append')
+            create_indexes: Whether to create indexes on foreign key columns
+        """
+        cursor = self.connection.cursor()
+        if not self.connection.in_transaction:
+            cursor.execute("BEGIN")
+        try:
+            for table_name, df in tables.items():
+                self._insert_table(cursor, table_name, df, if_exists)
+                self.loaded_tables.append(table_name)
+
+                if create_indexes:
+                    self._create_indexes(table_name, df, commit=False)
+        except BaseException:
+            self.connection.rollback()
+            raise
+        self.connection.commit()
+
+    def _insert_table(self, cursor: sqlite3.Cursor, table_name: str, df: pd.DataFrame, if_exists: str) -> None:
+        """
+        Create a table if needed and insert all DataFrame rows without committing.
+
+        Args:
+            cursor: Cursor of the open transaction
+            table_name: Name of the table
+            df: DataFrame to load
+            if_exists: How to behave if table exists ('fail', 'replace', 'append')
+        """
+        # pandas' own table object gives the CREATE TABLE statement, an INSERT with
+        # named columns and the row values converted as to_sql converts them
+        # (datetimes as Python datetimes, missing values as NULL)
+        table = pd.io.sql.SQLiteTable(table_name, pd.io.sql.SQLiteDatabase(self.connection), frame=df, index=False)
+
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+        exists = cursor.fetchone() is not None
+        if exists and if_exists == "fail":
+            raise ValueError(f"Table '{table_name}' already exists.")
+        if exists and if_exists == "replace":
+            cursor.execute(f'DROP TABLE "{table_name}"')
+            exists = False
+        if not exists:
+            cursor.execute(table.sql_schema())
+
+        _, columns = table.insert_data()
+        cursor.executemany(table.insert_statement(num_rows=1), zip(*columns, strict=True))
+        print(f"  Loaded {len(df)} rows into table: {table_name}")
+
     def _load_table(self, table_name: str, df: pd.DataFrame, if_exists: str = "replace") -> None:
         """
         Load a single table into SQLite.
@@ -81,13 +146,14 @@ class SQLiteLoader:
         df_copy.to_sql(table_name, self.connection, if_exists=if_exists, index=False)
         print(f"  Loaded {len(df_copy)} rows into table: {table_name}")
 
-    def _create_indexes(self, table_name: str, df: pd.DataFrame) -> None:
+    def _create_indexes(self, table_name: str, df: pd.DataFrame, commit: bool = True) -> None:
         """
         Create indexes on key columns.
 
         Args:
             table_name: Name of the table
             df: DataFrame to analyze for index creation
+            commit: Whether to commit once the indexes are created
         """
         cursor = self.connection.cursor()
 
@@ -110,7 +176,8 @@ class SQLiteLoader:
                 # Index may already exist or table structure doesn't allow it; safe to ignore
                 pass
 
-        self.connection.commit()
+        if commit:
+            self.connection.commit()
 
     def execute_ddl(self, ddl_statements: dict[str, str]) -> None:
         """
@@ -414,7 +481,10 @@ class DuckDBLoader:
         print("DUCKDB DATABASE SUMMARY")
         print(f"{'=' * 60}")
         if self.db_path:
-            size_kb = self.db_path.stat().st_size / 1024 if self.db_path.exists() else 0
+            try:
+                size_kb = self.db_path.stat().st_size / 1024
+            except FileNotFoundError:
+                size_kb = 0
             print(f"Database: {self.db_path}")
             print(f"Size: {size_kb:.1f} KB")
         else:
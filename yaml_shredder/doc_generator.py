@@ -191,9 +191,18 @@ class MarkdownDocGenerator:
         separator = "| " + " | ".join(["---"] * len(df.columns)) + " |"
         lines.append(separator)
 
+        # Render cell strings column by column: plain numpy numeric and boolean
+        # columns are converted in one vectorized cast and skip JSON/truncation checks
+        column_strings = []
+        for i in range(len(df.columns)):
+            series = df.iloc[:, i]
+            if series.dtype.kind in "biuf" and not pd.api.types.is_extension_array_dtype(series):
+                column_strings.append(series.to_numpy().astype(str).tolist())
+            else:
+                column_strings.append([truncate_value(val) for val in series])
+
         # Rows
-        for _, row in df.iterrows():
-            row_values = [truncate_value(val) for val in row]
+        for row_values in zip(*column_strings, strict=True):
             row_str = "| " + " | ".join(row_values) + " |"
             lines.append(row_str)
 
@@ -229,9 +238,9 @@ def generate_doc_from_yaml(
     from yaml_shredder.data_loader import SQLiteLoader
     from yaml_shredder.table_generator import TableGenerator
 
-    # Load YAML data
-    with open(yaml_path) as f:
-        data = yaml.safe_load(f)
+    # Load YAML data (libyaml-backed loader when available)
+    with open(yaml_path, "rb") as f:
+        data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     # Create temporary database
     temp_db = output_dir / f"{yaml_path.stem}.db"
@@ -1,6 +1,9 @@
 """Automatic JSON Schema generation from YAML/JSON files."""
 
+import copy
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -8,6 +11,81 @@ from typing import Any
 import yaml
 from genson import SchemaBuilder
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib json module
+    orjson = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Below this many files, process pool startup costs more than parallel parsing saves
+_PARALLEL_MIN_FILES = 16
+
+
+def _normalize_data(obj: Any) -> Any:
+    """
+    Normalize data by converting datetime objects to strings.
+
+    Args:
+        obj: Data to normalize
+
+    Returns:
+        Normalized data
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    elif isinstance(obj, dict):
+        return {k: _normalize_data(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_normalize_data(item) for item in obj]
+    else:
+        return obj
+
+
+def _load_json(raw: bytes) -> Any:
+    """
+    Parse JSON, with orjson when available.
+
+    orjson rejects NaN/Infinity and integers wider than 64 bits, which the json
+    module accepts, so such documents are parsed again with json.
+
+    Args:
+        raw: JSON document
+
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _parse_and_normalize(file_path: Path, is_json: bool) -> list[Any]:
+    """
+    Parse a YAML or JSON file into normalized documents.
+
+    Defined at module level so it can run in worker processes.
+
+    Args:
+        file_path: Path to the file
+        is_json: Whether to parse the file as JSON instead of YAML
+
+    Returns:
+        List of normalized documents (one for JSON, one per YAML document)
+    """
+    with open(file_path, "rb") as f:
+        if not is_json:
+            # A file without documents is one null example, as yaml.load returns for it
+            documents = list(yaml.load_all(f, Loader=_SafeLoader)) or [None]
+        else:
+            documents = [_load_json(f.read())]
+    return [_normalize_data(document) for document in documents]
+
 
 class SchemaGenerator:
     """Generate JSON Schema from multiple YAML/JSON examples."""
@@ -16,6 +94,8 @@ class SchemaGenerator:
         """Initialize the schema generator."""
         self.builder = SchemaBuilder()
         self.files_processed = []
+        # Schema built from the current examples; reset whenever an example is added
+        self._cached_schema = None
 
     def _normalize_data(self, obj: Any) -> Any:
         """
@@ -27,28 +107,29 @@ class SchemaGenerator:
         Returns:
             Normalized data
         """
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {k: self._normalize_data(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._normalize_data(item) for item in obj]
-        else:
-            return obj
+        return _normalize_data(obj)
 
     def add_yaml_file(self, file_path: str | Path) -> None:
         """
         Add a YAML file to the schema builder.
 
+        Multi-document files are streamed one document at a time, and each
+        document is added to the schema as a separate example. A file without
+        documents (e.g. an empty file) adds a single null example.
+
         Args:
             file_path: Path to YAML file
         """
         file_path = Path(file_path)
-        with open(file_path) as f:
-            data = yaml.safe_load(f)
-
-        normalized_data = self._normalize_data(data)
-        self.builder.add_object(normalized_data)
+        with open(file_path, "rb") as f:
+            empty = True
+            for document in yaml.load_all(f, Loader=_SafeLoader):
+                self.builder.add_object(self._normalize_data(document))
+                empty = False
+        if empty:
+            # Same null example as yaml.load returns for a file without documents
+            self.builder.add_object(None)
+        self._cached_schema = None
         self.files_processed.append(str(file_path))
 
     def add_json_file(self, file_path: str | Path) -> None:
@@ -59,31 +140,95 @@ class SchemaGenerator:
             file_path: Path to JSON file
         """
         file_path = Path(file_path)
-        with open(file_path) as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = _load_json(f.read())
 
         normalized_data = self._normalize_data(data)
         self.builder.add_object(normalized_data)
+        self._cached_schema = None
         self.files_processed.append(str(file_path))
 
-    def add_object(self, obj: dict[str, Any]) -> None:
+    def add_files(self, file_paths: list[str | Path], parallel: bool = False) -> None:
+        """
+        Add several YAML/JSON files to the schema builder.
+
+        Files with a .json suffix are parsed as JSON and all others as YAML. With
+        parallel set, large batches are parsed in worker processes (libyaml holds
+        the GIL, so threads would not parse concurrently); documents are still
+        added in the given order.
+
+        Args:
+            file_paths: Paths to YAML/JSON files
+            parallel: Whether large batches may be parsed in worker processes. Callers
+                must guard their entry point with ``if __name__ == "__main__":``
+                (required by the spawn start method, the default on macOS and Windows)
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        is_json = [file_path.suffix.lower() == ".json" for file_path in file_paths]
+
+        if not parallel or len(file_paths) < _PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+            for file_path, json_file in zip(file_paths, is_json, strict=True):
+                if json_file:
+                    self.add_json_file(file_path)
+                else:
+                    self.add_yaml_file(file_path)
+            return
+
+        # Parse in worker processes; builder updates stay serial and in file order
+        with ProcessPoolExecutor() as executor:
+            parsed = executor.map(_parse_and_normalize, file_paths, is_json, chunksize=8)
+            for file_path, documents in zip(file_paths, parsed, strict=True):
+                self._add_documents(documents, file_path)
+
+    def _add_documents(self, documents: list[Any], file_path: Path) -> None:
+        """
+        Add already normalized documents parsed from a file.
+
+        Args:
+            documents: Normalized documents from the file
+            file_path: Path the documents were parsed from
+        """
+        for document in documents:
+            self.builder.add_object(document)
+        self._cached_schema = None
+        self.files_processed.append(str(file_path))
+
+    def add_object(self, obj: dict[str, Any], source: str | Path | None = None) -> None:
         """
         Add a Python object to the schema builder.
 
         Args:
             obj: Dictionary object to add
+            source: Optional file the object was parsed from, recorded as processed
         """
         normalized_data = self._normalize_data(obj)
         self.builder.add_object(normalized_data)
+        self._cached_schema = None
+        if source is not None:
+            self.files_processed.append(str(source))
+
+    def _schema(self) -> dict[str, Any]:
+        """
+        Get the schema for the current examples, building it only when examples were added.
+
+        Returns:
+            Cached JSON schema; callers must not modify it
+        """
+        if self._cached_schema is None:
+            self._cached_schema = self.builder.to_schema()
+        return self._cached_schema
 
     def generate_schema(self) -> dict[str, Any]:
         """
         Generate the JSON schema from all added examples.
 
+        The schema is built once and reused until another example is added. Each
+        call returns a copy, so callers may modify the result.
+
         Returns:
             JSON schema as dictionary
         """
-        return self.builder.to_schema()
+        return copy.deepcopy(self._schema())
 
     def save_schema(self, output_path: str | Path) -> None:
         """
@@ -92,11 +237,15 @@ class SchemaGenerator:
         Args:
             output_path: Path where to save the schema
         """
-        schema = self.generate_schema()
+        schema = self._schema()
         output_path = Path(output_path)
 
-        with open(output_path, "w") as f:
-            json.dump(schema, f, indent=2)
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w") as f:
+                json.dump(schema, f, indent=2)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -105,7 +254,7 @@ class SchemaGenerator:
         Returns:
             Dictionary with statistics
         """
-        schema = self.generate_schema()
+        schema = self._schema()
         return {
             "files_processed": len(self.files_processed),
             "file_list": self.files_processed,
@@ -115,7 +264,7 @@ class SchemaGenerator:
 
 
 def generate_schema_from_directory(
-    directory: str | Path, pattern: str = "*.yaml", output_file: str | Path | None = None
+    directory: str | Path, pattern: str = "*.yaml", output_file: str | Path | None = None, parallel: bool = False
 ) -> dict[str, Any]:
     """
     Generate schema from all matching files in a directory.
@@ -124,6 +273,7 @@ def generate_schema_from_directory(
         directory: Directory to scan
         pattern: File pattern to match (default: *.yaml)
         output_file: Optional path to save schema
+        parallel: Whether large directories may be parsed in worker processes (see SchemaGenerator.add_files)
 
     Returns:
         Generated JSON schema
@@ -131,18 +281,18 @@ def generate_schema_from_directory(
     directory = Path(directory)
     generator = SchemaGenerator()
 
-    # Find all matching files
+    # Find all matching files (patterns may include directories, e.g. "sub/*.yaml")
     files = sorted(directory.rglob(pattern))
 
     if not files:
         raise ValueError(f"No files matching '{pattern}' found in {directory}")
 
     # Process each file
-    for file_path in files:
-        if pattern.endswith(".yaml") or pattern.endswith(".yml"):
-            generator.add_yaml_file(file_path)
-        elif pattern.endswith(".json"):
-            generator.add_json_file(file_path)
+    if not pattern.endswith((".yaml", ".yml", ".json")):
+        # Unsupported pattern: matching files are not parsed
+        files = []
+
+    generator.add_files(files, parallel=parallel)
 
     # Generate and optionally save schema
     schema = generator.generate_schema()
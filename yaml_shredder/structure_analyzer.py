@@ -1,8 +1,12 @@
 """Analyze and detect repeating structures in YAML/JSON data."""
 
+import sys
 from collections import defaultdict
 from typing import Any
 
+# Turns array index brackets into path separators: "a[0].b" -> "a.0.b"
+_PATH_BRACKETS = str.maketrans({"[": ".", "]": None})
+
 
 class StructureAnalyzer:
     """Analyze nested structures and detect repeating patterns."""
@@ -18,6 +22,10 @@ class StructureAnalyzer:
         self.arrays_found = []
         self.structure_patterns = defaultdict(list)
         self.max_depth = max_depth
+        # Table name of each object array path, computed once while analyzing
+        self._table_names: dict[str, str] = {}
+        # Interned structure signatures, keyed by key set
+        self._sig_cache: dict[frozenset, tuple[str, ...]] = {}
 
     def analyze(self, data: dict[str, Any], path: str = "", depth: int = 0) -> dict[str, Any]:
         """
@@ -92,16 +100,20 @@ class StructureAnalyzer:
             all_keys_union = set.union(*all_keys) if all_keys else set()
             optional_keys = all_keys_union - common_keys
 
-            # Detect structure pattern
-            structure_signature = tuple(sorted(common_keys))
+            # Detect structure pattern, reusing the same tuple for identical key sets
+            key_set = frozenset(common_keys)
+            structure_signature = self._sig_cache.get(key_set)
+            if structure_signature is None:
+                structure_signature = self._sig_cache[key_set] = tuple(sorted(common_keys))
             self.structure_patterns[structure_signature].append(path)
+            self._table_names[path] = self._path_to_table_name(path)
 
             return {
                 "path": path,
                 "length": len(array),
                 "type": "object_array",
                 "element_types": unique_types,
-                "common_keys": sorted(common_keys),
+                "common_keys": list(structure_signature),
                 "optional_keys": sorted(optional_keys),
                 "all_keys": sorted(all_keys_union),
                 "structure_signature": structure_signature,
@@ -126,11 +138,13 @@ class StructureAnalyzer:
 
         for array_info in self.arrays_found:
             if array_info.get("type") == "object_array":
-                # Object arrays are good table candidates
+                # Object arrays are good table candidates; names of arrays found by
+                # analyze() were computed there, any others are computed here
+                path = array_info["path"]
                 candidates.append(
                     {
-                        "path": array_info["path"],
-                        "table_name": self._path_to_table_name(array_info["path"]),
+                        "path": path,
+                        "table_name": self._table_names.get(path) or self._path_to_table_name(path),
                         "row_count": array_info["length"],
                         "columns": array_info["all_keys"],
                         "required_columns": array_info["common_keys"],
@@ -150,9 +164,8 @@ class StructureAnalyzer:
         Returns:
             Suggested table name
         """
-        # Remove array indices and clean up
-        parts = path.replace("[", ".").replace("]", "").split(".")
-        parts = [p for p in parts if p and not p.isdigit()]
+        # Remove array indices and clean up; numeric segments (indices, numeric keys) are dropped
+        parts = [p for p in path.translate(_PATH_BRACKETS).split(".") if p and not p.isdigit()]
 
         # Use the last meaningful part or join all
         if parts:
@@ -166,41 +179,40 @@ class StructureAnalyzer:
         Args:
             analysis: Analysis results from analyze()
         """
-        print(f"\n{'=' * 60}")
-        print("STRUCTURE ANALYSIS SUMMARY")
-        print(f"{'=' * 60}")
+        # Collect all lines and emit them with a single write
+        lines = [f"\n{'=' * 60}", "STRUCTURE ANALYSIS SUMMARY", f"{'=' * 60}"]
 
-        print(f"\nTotal arrays found: {analysis['total_arrays']}")
+        lines.append(f"\nTotal arrays found: {analysis['total_arrays']}")
 
-        print(f"\n{'-' * 60}")
-        print("ARRAYS DETECTED:")
-        print(f"{'-' * 60}")
+        lines.extend([f"\n{'-' * 60}", "ARRAYS DETECTED:", f"{'-' * 60}"])
 
         for i, array_info in enumerate(analysis["arrays"], 1):
-            print(f"\n{i}. Path: {array_info['path']}")
-            print(f"   Type: {array_info['type']}")
-            print(f"   Length: {array_info['length']}")
+            lines.append(f"\n{i}. Path: {array_info['path']}")
+            lines.append(f"   Type: {array_info['type']}")
+            lines.append(f"   Length: {array_info['length']}")
 
             if array_info["type"] == "object_array":
-                print(f"   Homogeneous: {array_info['is_homogeneous']}")
-                print(f"   Common keys ({len(array_info['common_keys'])}): {', '.join(array_info['common_keys'][:5])}")
+                lines.append(f"   Homogeneous: {array_info['is_homogeneous']}")
+                lines.append(
+                    f"   Common keys ({len(array_info['common_keys'])}): {', '.join(array_info['common_keys'][:5])}"
+                )
                 if len(array_info["common_keys"]) > 5:
-                    print(f"      ... and {len(array_info['common_keys']) - 5} more")
+                    lines.append(f"      ... and {len(array_info['common_keys']) - 5} more")
                 if array_info["optional_keys"]:
-                    print(
+                    lines.append(
                         f"   Optional keys ({len(array_info['optional_keys'])}): {', '.join(list(array_info['optional_keys'])[:3])}"
                     )
 
-        print(f"\n{'-' * 60}")
-        print("TABLE CANDIDATES:")
-        print(f"{'-' * 60}")
+        lines.extend([f"\n{'-' * 60}", "TABLE CANDIDATES:", f"{'-' * 60}"])
 
         candidates = self.get_table_candidates()
         for i, candidate in enumerate(candidates, 1):
-            print(f"\n{i}. Table: {candidate['table_name']}")
-            print(f"   Source: {candidate['path']}")
-            print(f"   Rows: {candidate['row_count']}")
-            print(f"   Columns: {len(candidate['columns'])}")
-            print(f"   Required: {len(candidate['required_columns'])}")
+            lines.append(f"\n{i}. Table: {candidate['table_name']}")
+            lines.append(f"   Source: {candidate['path']}")
+            lines.append(f"   Rows: {candidate['row_count']}")
+            lines.append(f"   Columns: {len(candidate['columns'])}")
+            lines.append(f"   Required: {len(candidate['required_columns'])}")
+
+        lines.append(f"\n{'=' * 60}\n")
 
-        print(f"\n{'=' * 60}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -1,9 +1,145 @@
 """Generate tabular structures from nested YAML/JSON data."""
 
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Bound once at import; used for every nested dict kept as a JSON string
+_json_dumps = json.dumps
+
+
+class _ContainerKinds(dict):
+    """Map a value type to dict or list if it is one of those or a subclass, else None.
+
+    Each type is classified with issubclass once, so dict and list subclasses such as
+    OrderedDict are walked like plain dicts and lists at the cost of one dict lookup.
+    """
+
+    def __missing__(self, value_type: type) -> type | None:
+        """Classify and remember a value type not seen before."""
+        kind = dict if issubclass(value_type, dict) else list if issubclass(value_type, list) else None
+        self[value_type] = kind
+        return kind
+
+
+# Container kind of each value type seen while walking data
+_CONTAINER_KINDS = _ContainerKinds({dict: dict, list: list})
+
+# Fill value for keys missing from some array items (matches DataFrame-from-records behavior)
+_MISSING = float("nan")
+
+# numpy dtypes for columns whose values all have one of these exact Python types
+# (the same dtypes pandas would infer for them)
+_COLUMN_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+# Arrow-backed strings with NaN as the missing value (the pandas 3 default "str" dtype).
+# Older pandas without na_value support keeps string columns as object.
+try:
+    _STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    _STRING_DTYPE = None
+
+# Rows per parquet row group, and the table size above which rows are written batch by batch
+_PARQUET_ROW_GROUP_SIZE = 64_000
+_PARQUET_BATCH_MIN_ROWS = 1_000_000
+
+# Upper bound on threads writing parquet files at once
+_SAVE_MAX_WORKERS = 8
+
+
+# Columns whose values identify an array item; a table with any of them unique has no duplicate rows
+_IDENTIFYING_KEYS = ("id", "name", "code")
+
+
+@functools.lru_cache(maxsize=4096)
+def _path_to_table_name_cached(path: str) -> str:
+    """
+    Convert path to table name, caching results for recurring paths.
+
+    Args:
+        path: Path like "actions" or "warehouse.settings"
+
+    Returns:
+        Table name
+    """
+    return path.replace(".", "_").upper()
+
+
+def _column_array(values: list[Any]) -> Any:
+    """
+    Convert a column's values to a typed array when its type is known up front.
+
+    Checking the value types in one C-level pass and building the array directly is
+    much cheaper than pandas' per-value inference, especially for integer columns.
+
+    Args:
+        values: Column values
+
+    Returns:
+        A numpy array for uniformly int, float or bool columns, an Arrow-backed string
+        array for all-str columns, otherwise the values unchanged
+    """
+    value_types = set(map(type, values))
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+        if value_type is str and _STRING_DTYPE is not None:
+            return pd.array(values, dtype=_STRING_DTYPE)
+        dtype = _COLUMN_DTYPES.get(value_type)
+        if dtype is not None:
+            try:
+                return np.array(values, dtype=dtype)
+            except OverflowError:
+                # Integers beyond int64 are left to pandas (uint64 or object)
+                pass
+    return values
+
+
+def _drop_duplicate_rows(df: pd.DataFrame, subset: list[str]) -> pd.DataFrame:
+    """
+    Drop duplicate rows (keeping the first occurrence), skipping the full-row check when possible.
+
+    Checking a single identifying column for uniqueness is much cheaper than hashing
+    every row across all columns, and most id-bearing arrays have no duplicates.
+
+    Args:
+        df: Table to deduplicate
+        subset: Columns that define a duplicate row
+
+    Returns:
+        The table without duplicate rows
+    """
+    if len(df) < 2:
+        return df
+    for key in _IDENTIFYING_KEYS:
+        # is_unique tells None and NaN apart but drop_duplicates does not, so nulls need the full check
+        if key in subset and df[key].notna().all() and df[key].is_unique:
+            return df
+    return df.drop_duplicates(subset=subset, keep="first")
+
+
+def _write_parquet(df: pd.DataFrame, filepath: Path) -> None:
+    """
+    Write a DataFrame to a snappy-compressed parquet file.
+
+    Args:
+        df: DataFrame to write
+        filepath: Destination parquet file
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(filepath, table.schema, compression="snappy") as writer:
+        if table.num_rows > _PARQUET_BATCH_MIN_ROWS:
+            for batch in table.to_batches(max_chunksize=_PARQUET_ROW_GROUP_SIZE):
+                writer.write_batch(batch, row_group_size=_PARQUET_ROW_GROUP_SIZE)
+        else:
+            writer.write_table(table, row_group_size=_PARQUET_ROW_GROUP_SIZE)
 
 
 class TableGenerator:
@@ -23,6 +159,16 @@ class TableGenerator:
         self.relationships = []
         self.max_depth = max_depth
 
+    def reset(self) -> None:
+        """
+        Forget previously generated tables and relationships so the generator can be reused.
+
+        Fresh containers are bound rather than clearing the old ones in place, so a
+        tables dict returned by an earlier generate_tables call stays intact.
+        """
+        self.tables = {}
+        self.relationships = []
+
     def generate_tables(
         self, data: dict[str, Any], root_table_name: str = "ROOT", source_file: Path | None = None
     ) -> dict[str, pd.DataFrame]:
@@ -34,6 +180,12 @@ class TableGenerator:
         - Root-level dictionaries → separate tables (one per dict key)
         - Root-level arrays → separate tables (existing behavior)
 
+        Tables accumulate across calls on the same generator. To process a batch of
+        files with one instance, call reset() before each file:
+
+            gen.reset()
+            tables = gen.generate_tables(data, source_file=path)
+
         Args:
             data: Source data dictionary
             root_table_name: Name for the root table (used if no source_file)
@@ -55,23 +207,26 @@ class TableGenerator:
         # Determine descriptor table name from file
         descriptor_table_name = source_file.stem.upper() if source_file else root_table_name
 
-        # Separate root-level data into scalars, dicts, and arrays
+        # Separate root-level data into scalars and dicts, and queue the values that
+        # can hold arrays of objects so they are not rediscovered by a second pass
         root_scalars = {}
         root_dicts = {}
-        root_arrays = {}
+        pending = []
 
         for key, value in data.items():
             if isinstance(value, dict):
                 root_dicts[key] = value
+                pending.append((key, value))
             elif isinstance(value, list):
-                root_arrays[key] = value
+                if value and _CONTAINER_KINDS[type(value[0])] is dict:
+                    pending.append((key, value))
             else:
                 root_scalars[key] = value
 
         # Create descriptor table with scalar attributes only
         if root_scalars:
             df = pd.DataFrame([root_scalars])
-            self.tables[descriptor_table_name] = df.drop_duplicates()
+            self.tables[descriptor_table_name] = _drop_duplicate_rows(df, list(df.columns))
 
         # Process root-level dictionaries as separate tables
         for dict_key, dict_value in root_dicts.items():
@@ -80,16 +235,20 @@ class TableGenerator:
             flattened = self._flatten_dict(dict_value, depth=0)
             if flattened:
                 df = pd.DataFrame([flattened])
-                self.tables[table_name] = df.drop_duplicates()
+                self.tables[table_name] = _drop_duplicate_rows(df, list(df.columns))
 
-        # Process arrays at root level (arrays of objects become tables)
-        self._process_structure(data, descriptor_table_name, {})
+        # Process arrays (arrays of objects become tables), in root key order
+        for key, value in pending:
+            if isinstance(value, list):
+                self._create_table_from_array(value, self._path_to_table_name(key), descriptor_table_name, {})
+            else:
+                self._process_structure(value, descriptor_table_name, {}, key)
 
         return self.tables
 
     def _process_structure(self, obj: Any, parent_table: str, parent_keys: dict[str, Any], path: str = "") -> None:
         """
-        Recursively process structure to extract tables from arrays.
+        Walk a structure to extract tables from arrays.
 
         Args:
             obj: Object to process
@@ -97,17 +256,30 @@ class TableGenerator:
             parent_keys: Keys from parent for foreign key relationships
             path: Current path in structure
         """
-        if isinstance(obj, dict):
-            for key, value in obj.items():
+        if _CONTAINER_KINDS[type(obj)] is not dict:
+            return
+
+        # Iterative depth-first walk: each frame is (path, remaining items). Descending
+        # into a nested dict suspends the parent frame, so tables are created in the
+        # same order as a recursive traversal, with no recursion depth limit.
+        stack = [(path, iter(obj.items()))]
+        while stack:
+            path, items = stack[-1]
+            for key, value in items:
                 current_path = f"{path}.{key}" if path else key
 
-                if isinstance(value, list) and value and isinstance(value[0], dict):
+                value_kind = _CONTAINER_KINDS[type(value)]
+                if value_kind is list and value and _CONTAINER_KINDS[type(value[0])] is dict:
                     # Array of objects -> create table
                     table_name = self._path_to_table_name(current_path)
                     self._create_table_from_array(value, table_name, parent_table, parent_keys)
-                elif isinstance(value, dict):
+                elif value_kind is dict:
                     # Nested object -> continue traversal for arrays
-                    self._process_structure(value, parent_table, parent_keys, current_path)
+                    stack.append((current_path, iter(value.items())))
+                    break
+            else:
+                # Frame exhausted
+                stack.pop()
 
     def _create_table_from_array(
         self, array: list[dict[str, Any]], table_name: str, parent_table: str, parent_keys: dict[str, Any]
@@ -121,28 +293,57 @@ class TableGenerator:
             parent_table: Parent table name
             parent_keys: Parent keys for relationships
         """
-        # Flatten objects and add parent foreign keys
-        rows = []
+        # Flatten objects, accumulating values column by column
+        # (columns keep first-seen order; cells for keys a row lacks are filled with NaN).
+        # Nested arrays of objects are found in the same pass and queued, so their tables
+        # are created after this one.
+        n_rows = len(array)
+        columns = {}
+        head = None
+        pending = []
         for i, item in enumerate(array):
-            row = self._flatten_dict(item, depth=0)
-
-            # Add parent foreign keys
-            for parent_key, parent_value in parent_keys.items():
-                row[f"parent_{parent_key}"] = parent_value
-
-            # Add row index for ordering
-            row["_row_index"] = i
-
-            rows.append(row)
+            for col, value in self._flatten_dict(item, depth=0).items():
+                values = columns.get(col)
+                if values is None:
+                    values = columns[col] = []
+                if len(values) < i:
+                    values.extend([_MISSING] * (i - len(values)))
+                values.append(value)
+            if head is None:
+                head = list(columns)
 
-        # Create DataFrame and remove duplicates
-        df = pd.DataFrame(rows)
+            for key, value in item.items():
+                if _CONTAINER_KINDS[type(value)] is list and value and _CONTAINER_KINDS[type(value[0])] is dict:
+                    # Identifying key from this level, added to the parent keys for the child table
+                    id_key = next((k for k in _IDENTIFYING_KEYS if k in item), None)
+                    pending.append((value, f"{table_name}_{key}", id_key, item.get(id_key)))
+
+        for values in columns.values():
+            if len(values) < n_rows:
+                values.extend([_MISSING] * (n_rows - len(values)))
+
+        # Parent foreign keys and the row index are the same for every row (or a plain
+        # range), so build them as whole columns. They go right after the first row's
+        # own columns and override any flattened column of the same name.
+        fixed = {f"parent_{parent_key}": [parent_value] * n_rows for parent_key, parent_value in parent_keys.items()}
+        fixed["_row_index"] = range(n_rows)
+        ordered = {col: columns.pop(col) for col in head}
+        ordered.update(fixed)
+        for col in fixed:
+            columns.pop(col, None)
+        ordered.update(columns)
+        columns = ordered
+
+        # Create DataFrame in one shot (uniformly typed columns skip inference) and remove duplicates
+        df = pd.DataFrame(
+            {col: _column_array(values) if type(values) is list else values for col, values in columns.items()}
+        )
 
         # Drop duplicate rows (keep first occurrence)
         # Exclude _row_index from duplicate check if it exists
         subset_cols = [col for col in df.columns if col != "_row_index"]
         if subset_cols:
-            df = df.drop_duplicates(subset=subset_cols, keep="first")
+            df = _drop_duplicate_rows(df, subset_cols)
 
         # Store table
         self.tables[table_name] = df
@@ -153,19 +354,24 @@ class TableGenerator:
                 {"parent_table": parent_table, "child_table": table_name, "foreign_keys": list(parent_keys.keys())}
             )
 
-        # Process nested arrays within this array
-        for i, item in enumerate(array):  # noqa: B007
-            item_keys = {**parent_keys}
-            # Add identifying keys from this level
-            for key in ["id", "name", "code"]:
-                if key in item:
-                    item_keys[key] = item[key]
-                    break
-
-            for key, value in item.items():
-                if isinstance(value, list) and value and isinstance(value[0], dict):
-                    nested_table_name = f"{table_name}_{key}"
-                    self._create_table_from_array(value, nested_table_name, table_name, item_keys)
+        # Process nested arrays within this array. The item's identifying key is pushed
+        # onto the shared parent_keys dict for the child call and popped (or its previous
+        # value restored) afterwards, instead of copying parent_keys for every item.
+        for value, nested_table_name, id_key, id_value in pending:
+            if id_key is None:
+                self._create_table_from_array(value, nested_table_name, table_name, parent_keys)
+                continue
+
+            had_key = id_key in parent_keys
+            previous = parent_keys.get(id_key)
+            parent_keys[id_key] = id_value
+            try:
+                self._create_table_from_array(value, nested_table_name, table_name, parent_keys)
+            finally:
+                if had_key:
+                    parent_keys[id_key] = previous
+                else:
+                    del parent_keys[id_key]
 
     def _flatten_dict(self, d: dict[str, Any], parent_key: str = "", sep: str = "_", depth: int = 0) -> dict[str, Any]:
         """
@@ -180,39 +386,67 @@ class TableGenerator:
         Returns:
             Flattened dictionary
         """
-        import json
+        # Flat items (no nested dicts or lists) are common in arrays of records; copy
+        # them in one C-level call instead of walking them key by key
+        if not parent_key and not any(map(_CONTAINER_KINDS.__getitem__, map(type, d.values()))):
+            return dict(d)
 
-        items = []
+        out = {}
+        self._flatten_dict_into(d, out, parent_key, sep, depth)
+        return out
 
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+    def _flatten_dict_into(
+        self, d: dict[str, Any], out: dict[str, Any], parent_key: str = "", sep: str = "_", depth: int = 0
+    ) -> None:
+        """
+        Flatten nested dictionary with depth control, writing columns into an existing dict.
 
-            if isinstance(v, dict):
-                # max_depth controls how many levels to flatten
-                # depth=0 means we're at root level looking at first-level nested dicts
-                # If max_depth=1, we stop flattening when we encounter nested dicts (depth >= 0)
-                # If max_depth=2, we flatten first level but stop at second level (depth >= 1)
-                if self.max_depth is not None and depth >= self.max_depth - 1:
-                    # Keep nested dict as JSON string
-                    items.append((new_key, json.dumps(v, default=str)))
+        Args:
+            d: Dictionary to flatten
+            out: Dictionary that receives the flattened key/value pairs
+            parent_key: Parent key for nested items
+            sep: Separator for nested keys
+            depth: Current depth in flattening (0 = root level)
+        """
+        # Iterative depth-first walk: each frame is (key prefix including the trailing
+        # separator, depth, remaining items). Descending into a nested dict suspends the
+        # parent frame, so keys keep the same order a recursive traversal would produce.
+        stack = [(parent_key + sep if parent_key else "", depth, iter(d.items()))]
+        while stack:
+            prefix, level, items = stack[-1]
+            for k, v in items:
+                if prefix:
+                    new_key = prefix + (k if type(k) is str else str(k))
                 else:
-                    # Continue flattening
-                    items.extend(self._flatten_dict(v, new_key, sep=sep, depth=depth + 1).items())
-            elif isinstance(v, list):
-                # For lists of objects, skip (they become separate tables)
-                # For simple lists, convert to string
-                if v:
-                    if isinstance(v[0], dict):
-                        # Skip lists of objects (they become separate tables)
-                        pass
+                    new_key = k
+
+                # Container kind lookup by exact type is cheaper than isinstance
+                t = _CONTAINER_KINDS[type(v)]
+                if t is dict:
+                    # max_depth controls how many levels to flatten
+                    # depth=0 means we're at root level looking at first-level nested dicts
+                    # If max_depth=1, we stop flattening when we encounter nested dicts (depth >= 0)
+                    # If max_depth=2, we flatten first level but stop at second level (depth >= 1)
+                    if self.max_depth is not None and level >= self.max_depth - 1:
+                        # Keep nested dict as JSON string
+                        out[new_key] = _json_dumps(v, default=str)
                     else:
+                        # Continue flattening
+                        child_prefix = (new_key if type(new_key) is str else str(new_key)) + sep if new_key else ""
+                        stack.append((child_prefix, level + 1, iter(v.items())))
+                        break
+                elif t is list:
+                    # For lists of objects, skip (they become separate tables)
+                    # For simple lists, convert to string
+                    if v and _CONTAINER_KINDS[type(v[0])] is not dict:
                         # Simple list - join as string
-                        items.append((new_key, ", ".join(map(str, v))))
+                        out[new_key] = ", ".join(map(str, v))
+                else:
+                    # Scalar value
+                    out[new_key] = v
             else:
-                # Scalar value
-                items.append((new_key, v))
-
-        return dict(items)
+                # Frame exhausted
+                stack.pop()
 
     def _path_to_table_name(self, path: str) -> str:
         """
@@ -224,27 +458,40 @@ class TableGenerator:
         Returns:
             Table name
         """
-        parts = path.replace(".", "_").split("_")
-        return "_".join(parts).upper()
+        return _path_to_table_name_cached(path)
 
-    def save_tables(self, output_dir: str | Path, format: str = "csv") -> None:
+    def save_tables(self, output_dir: str | Path, format: str = "parquet") -> None:
         """
         Save all tables to files.
 
+        Parquet is the default: snappy-compressed columnar files are several times
+        smaller than CSV and much faster to write and read back. CSV remains
+        available for tools that need plain text.
+
         Args:
             output_dir: Directory to save tables
-            format: Output format ('csv', 'parquet', 'excel')
+            format: Output format ('parquet', 'csv', 'excel')
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        if format == "parquet":
+            # pyarrow encodes and writes with the GIL released, so tables are written
+            # concurrently; the summary lines are printed afterwards in table order
+            filepaths = [output_dir / f"{table_name}.parquet" for table_name in self.tables]
+            max_workers = min(_SAVE_MAX_WORKERS, os.cpu_count() or 1, max(len(filepaths), 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_write_parquet, self.tables.values(), filepaths))
+
+            for (table_name, df), filepath in zip(self.tables.items(), filepaths, strict=True):
+                print(f"Saved {table_name}: {len(df)} rows, {len(df.columns)} columns -> {filepath}")
+            return
+
+        # CSV and Excel formatting hold the GIL, so these are written one at a time
         for table_name, df in self.tables.items():
             if format == "csv":
                 filepath = output_dir / f"{table_name}.csv"
                 df.to_csv(filepath, index=False)
-            elif format == "parquet":
-                filepath = output_dir / f"{table_name}.parquet"
-                df.to_parquet(filepath, index=False)
             elif format == "excel":
                 filepath = output_dir / f"{table_name}.xlsx"
                 df.to_excel(filepath, index=False)
@@ -3,9 +3,15 @@
 Compares two YAML files by loading them into SQLite or DuckDB databases and comparing their structure and data.
 """
 
+import hashlib
+import io
 import logging
+import os
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import yaml
@@ -16,35 +22,340 @@ from yaml_shredder.table_generator import TableGenerator
 
 log = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Tables counted per UNION ALL query (SQLite allows at most 500 terms in a compound SELECT)
+_COUNT_BATCH_SIZE = 256
+
+# Below this combined input size, process pool startup costs more than generating
+# the tables of both files in parallel saves
+_PARALLEL_MIN_BYTES = 1 << 20
+
+
+def _open_sqlite_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open a SQLite database read-only, tuned for metadata queries.
+
+    Args:
+        db_path: Path to the database
+
+    Returns:
+        Read-only connection to the database
+    """
+    # mode=ro opens without write locks or WAL checkpointing; as_uri() escapes special characters
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+def _duckdb_table_columns(connection) -> dict[str, list[tuple[str, str]]]:
+    """Get (column name, column type) pairs for all tables of a DuckDB database in one query.
+
+    Args:
+        connection: DuckDB connection
+
+    Returns:
+        Dictionary mapping table names (sorted) to their (name, type) column pairs in column order
+    """
+    rows = connection.execute(
+        "SELECT table_name, column_name, data_type FROM information_schema.columns "
+        "WHERE table_schema='main' ORDER BY table_name, ordinal_position"
+    ).fetchall()
+    table_columns = {}
+    for table_name, column_name, data_type in rows:
+        columns = table_columns.get(table_name)
+        if columns is None:
+            columns = table_columns[table_name] = []
+        columns.append((column_name, data_type))
+    return table_columns
+
+
+def _count_rows(connection, table_names: list[str]) -> dict[str, int]:
+    """Count rows of several tables with one UNION ALL query per batch of tables.
+
+    Args:
+        connection: SQLite cursor/connection or DuckDB connection
+        table_names: Tables to count
+
+    Returns:
+        Dictionary mapping table names to their row counts, in table_names order
+    """
+    row_counts = {}
+    for start in range(0, len(table_names), _COUNT_BATCH_SIZE):
+        batch = table_names[start : start + _COUNT_BATCH_SIZE]
+        sql = " UNION ALL ".join(
+            f'SELECT {idx} AS idx, COUNT(*) AS c FROM "{table_name}"' for idx, table_name in enumerate(batch)
+        )
+        counts = dict(connection.execute(sql).fetchall())
+        for idx, table_name in enumerate(batch):
+            row_counts[table_name] = int(counts[idx])
+    return row_counts
+
+
+def _write_report(output_path: Path, report: str) -> None:
+    """Write a report file atomically.
+
+    The report is written in binary to a temporary file next to the target and
+    then moved into place, so readers never see a partially written report.
+
+    Args:
+        output_path: Path of the report file
+        report: Report text
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(report.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_yaml_file(yaml_path: Path) -> Any:
+    """Parse a YAML file.
+
+    Args:
+        yaml_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+    """
+    try:
+        with open(yaml_path, "rb") as f:
+            return yaml.load(f, Loader=_SafeLoader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found: {yaml_path}") from None
+
+
+def _generate_tables(
+    yaml_path: Path, data: Any, root_table_name: str, max_depth: int | None
+) -> dict[str, pd.DataFrame]:
+    """Generate tables from a YAML file, parsing it unless data is given.
+
+    Defined at module level so it can run in worker processes.
+
+    Args:
+        yaml_path: Path to the YAML file
+        data: Already parsed contents of the file, or None to parse it
+        root_table_name: Name for the root table
+        max_depth: Maximum depth for flattening nested dictionaries
+
+    Returns:
+        Dictionary of table_name -> DataFrame
+    """
+    if data is None:
+        data = _load_yaml_file(yaml_path)
+    table_gen = TableGenerator(max_depth=max_depth)
+    return table_gen.generate_tables(data, root_table_name=root_table_name, source_file=yaml_path)
+
+
+def _same_file_contents(path1: Path, path2: Path) -> bool:
+    """Check whether two files have identical contents.
+
+    Args:
+        path1: Path to the first file
+        path2: Path to the second file
+
+    Returns:
+        True if both files contain the same bytes
+    """
+    try:
+        if os.path.samefile(path1, path2):
+            return True
+        if os.path.getsize(path1) != os.path.getsize(path2):
+            return False
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"YAML file not found: {e.filename}") from None
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        return hashlib.file_digest(f1, "blake2b").digest() == hashlib.file_digest(f2, "blake2b").digest()
+
+
+def _pending_parse_bytes(yaml_path: Path, data: Any) -> int:
+    """Get the size of an input file that still has to be parsed.
+
+    Args:
+        yaml_path: Path to the YAML file
+        data: Already parsed contents of the file, or None
+
+    Returns:
+        File size in bytes, or 0 if the data is given or the file does not exist
+        (a missing file is reported when it is parsed)
+    """
+    if data is not None:
+        return 0
+    try:
+        return os.path.getsize(yaml_path)
+    except FileNotFoundError:
+        return 0
+
+
+def _generate_table_pair(
+    yaml1_path: Path,
+    yaml2_path: Path,
+    data1: Any,
+    data2: Any,
+    root_table_name: str,
+    max_depth: int | None,
+    parallel: bool = False,
+) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+    """Generate tables from two YAML files, parsing each unless its data is given.
+
+    The two files are independent and CPU-bound, so with parallel set, large
+    inputs are handled in two worker processes.
+
+    Args:
+        yaml1_path: Path to the first YAML file
+        yaml2_path: Path to the second YAML file
+        data1: Already parsed contents of the first file, or None to parse it
+        data2: Already parsed contents of the second file, or None to parse it
+        root_table_name: Name for the root table of both files
+        max_depth: Maximum depth for flattening nested dictionaries
+        parallel: Whether large inputs may be handled in worker processes. Only enable
+            this from a script entry point: under the spawn start method the workers
+            re-import the main module.
+
+    Returns:
+        Tuple of (tables of the first file, tables of the second file)
+    """
+    if data1 is None and data2 is None and _same_file_contents(yaml1_path, yaml2_path):
+        # Identical files: parse once, and flatten once unless the file names differ
+        # (the descriptor table is named after the file)
+        data = _load_yaml_file(yaml1_path)
+        tables1 = _generate_tables(yaml1_path, data, root_table_name, max_depth)
+        if Path(yaml1_path).stem == Path(yaml2_path).stem:
+            return tables1, tables1
+        return tables1, _generate_tables(yaml2_path, data, root_table_name, max_depth)
+
+    pending_bytes = _pending_parse_bytes(yaml1_path, data1) + _pending_parse_bytes(yaml2_path, data2)
+    if parallel and (os.cpu_count() or 1) > 1 and pending_bytes >= _PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(_generate_tables, yaml1_path, data1, root_table_name, max_depth)
+            future2 = executor.submit(_generate_tables, yaml2_path, data2, root_table_name, max_depth)
+            return future1.result(), future2.result()
+    return (
+        _generate_tables(yaml1_path, data1, root_table_name, max_depth),
+        _generate_tables(yaml2_path, data2, root_table_name, max_depth),
+    )
+
+
+def _compare_metadata(
+    db1_name: str,
+    db2_name: str,
+    db1_schemas: dict[str, list[tuple[str, str]]],
+    db1_counts: dict[str, int],
+    db2_schemas: dict[str, list[tuple[str, str]]],
+    db2_counts: dict[str, int],
+) -> dict:
+    """Compare table schemas and row counts of two databases.
+
+    Args:
+        db1_name: Name of the first database
+        db2_name: Name of the second database
+        db1_schemas: Table name -> (name, type) column pairs of the first database
+        db1_counts: Table name -> row count of the first database
+        db2_schemas: Table name -> (name, type) column pairs of the second database
+        db2_counts: Table name -> row count of the second database
+
+    Returns:
+        Dictionary containing comparison results
+    """
+    db1_tables = set(db1_schemas.keys())
+    db2_tables = set(db2_schemas.keys())
+
+    comparison = {
+        "db1_name": db1_name,
+        "db2_name": db2_name,
+        "tables_only_in_db1": sorted(db1_tables - db2_tables),
+        "tables_only_in_db2": sorted(db2_tables - db1_tables),
+        "common_tables": sorted(db1_tables & db2_tables),
+        "schema_differences": {},
+        "row_count_differences": {},
+    }
+
+    # Compare schemas for common tables
+    for table_name in comparison["common_tables"]:
+        # Compare column names, then types of the columns both tables have
+        schema1_cols = dict(db1_schemas[table_name])
+        schema2_cols = dict(db2_schemas[table_name])
+
+        cols_only_in_1 = [(name, col_type) for name, col_type in schema1_cols.items() if name not in schema2_cols]
+        cols_only_in_2 = [(name, col_type) for name, col_type in schema2_cols.items() if name not in schema1_cols]
+        type_mismatches = [
+            (name, col_type, schema2_cols[name])
+            for name, col_type in schema1_cols.items()
+            if name in schema2_cols and schema2_cols[name] != col_type
+        ]
+
+        if cols_only_in_1 or cols_only_in_2 or type_mismatches:
+            comparison["schema_differences"][table_name] = {
+                "columns_only_in_db1": sorted(cols_only_in_1),
+                "columns_only_in_db2": sorted(cols_only_in_2),
+                "type_mismatches": sorted(type_mismatches),
+            }
+
+        # Compare row counts
+        count1 = db1_counts[table_name]
+        count2 = db2_counts[table_name]
+        if count1 != count2:
+            comparison["row_count_differences"][table_name] = {
+                "db1_count": count1,
+                "db2_count": count2,
+                "difference": count2 - count1,
+            }
+
+    return comparison
+
 
 class YAMLComparator:
     """Compare two YAML files by converting them to SQLite or DuckDB databases and comparing schemas/data."""
 
-    def __init__(self, output_dir: Path | None = None, use_duckdb: bool = False):
+    def __init__(self, output_dir: Path | None = None, use_duckdb: bool = False, parallel: bool = False):
         """Initialize the YAML comparator.
 
         Args:
             output_dir: Directory to store temporary databases. Defaults to ./temp_dbs/
             use_duckdb: If True, use DuckDB instead of SQLite (faster for complex data)
+            parallel: If True, generate the tables of two large files in worker processes.
+                Callers must guard their entry point with ``if __name__ == "__main__":``
+                (required by the spawn start method, the default on macOS and Windows)
         """
         self.output_dir = output_dir or Path("./temp_dbs")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.use_duckdb = use_duckdb
+        self.parallel = parallel
 
-    def load_yaml_to_db(self, yaml_path: Path, root_table_name: str = "root", max_depth: int | None = None) -> Path:
+    def load_yaml_to_db(
+        self,
+        yaml_path: Path,
+        root_table_name: str = "root",
+        max_depth: int | None = None,
+        data: Any = None,
+        tables: dict[str, pd.DataFrame] | None = None,
+    ) -> Path:
         """Load a YAML file into a SQLite or DuckDB database.
 
         Args:
             yaml_path: Path to the YAML file
             root_table_name: Name for the root table
             max_depth: Maximum depth for flattening nested dictionaries
+            data: Already parsed contents of the YAML file. If provided, the file is not read again.
+            tables: Tables already generated from the YAML file. If provided, the file is neither
+                read nor flattened again.
 
         Returns:
             Path to the created database
         """
         yaml_path = Path(yaml_path)
-        if not yaml_path.exists():
-            raise FileNotFoundError(f"YAML file not found: {yaml_path}")
+        if data is None and tables is None:
+            # Reading the file doubles as the existence check (no separate stat call)
+            data = _load_yaml_file(yaml_path)
 
         # Create database path based on YAML filename
         db_ext = ".duckdb" if self.use_duckdb else ".db"
@@ -52,15 +363,14 @@ class YAMLComparator:
 
         log.info(f"Loading {yaml_path} into {db_path} (using {'DuckDB' if self.use_duckdb else 'SQLite'})")
 
-        # Load YAML data
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+        if tables is None:
+            # Generate tables from YAML structure
+            table_gen = TableGenerator(max_depth=max_depth)
+            tables = table_gen.generate_tables(data, root_table_name=root_table_name, source_file=yaml_path)
+            # The parsed document is not needed for the insert; free it before loading
+            del data
 
-        # Generate tables from YAML structure
-        table_gen = TableGenerator(max_depth=max_depth)
-        tables = table_gen.generate_tables(data, root_table_name=root_table_name, source_file=yaml_path)
-
-        log.info(f"Generated {len(tables)} tables from {yaml_path.name}")
+            log.info(f"Generated {len(tables)} tables from {yaml_path.name}")
 
         # Load tables into chosen database
         if self.use_duckdb:
@@ -70,7 +380,11 @@ class YAMLComparator:
 
         loader.connect()
         try:
-            loader.load_tables(tables, if_exists="replace", create_indexes=True)
+            if self.use_duckdb:
+                loader.load_tables(tables, if_exists="replace", create_indexes=True)
+            else:
+                # One commit for all tables and indexes instead of one per table
+                loader.load_tables(tables, if_exists="replace", create_indexes=True, single_transaction=True)
             log.info(f"Successfully loaded data into {db_path}")
         finally:
             loader.disconnect()
@@ -88,37 +402,87 @@ class YAMLComparator:
         """
         if self.use_duckdb:
             # Use DuckDB
-            loader = DuckDBLoader(db_path)
-            loader.connect()
-            try:
-                table_names = loader.list_tables()
-                table_schemas = {}
-                for table_name in table_names:
-                    schema_df = loader.get_table_info(table_name)
-                    table_schemas[table_name] = schema_df
-                return table_schemas
-            finally:
-                loader.disconnect()
+            with DuckDBLoader(db_path) as loader:
+                return {
+                    table_name: pd.DataFrame(columns, columns=["name", "type"])
+                    for table_name, columns in _duckdb_table_columns(loader.connection).items()
+                }
         else:
-            # Use SQLite
-            conn = sqlite3.connect(db_path)
+            # Use SQLite; fetch through a plain cursor rather than pandas query machinery
+            conn = _open_sqlite_readonly(db_path)
             try:
-                # Get list of tables
-                tables_query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-                tables_df = pd.read_sql_query(tables_query, conn)
-                table_names = tables_df["name"].tolist()
-
-                # Get schema for each table
+                cursor = conn.cursor()
                 table_schemas = {}
-                for table_name in table_names:
-                    schema_query = f'PRAGMA table_info("{table_name}")'
-                    schema_df = pd.read_sql_query(schema_query, conn)
-                    table_schemas[table_name] = schema_df
+                for table_name in self._sqlite_table_names(cursor):
+                    cursor.execute(f'PRAGMA table_info("{table_name}")')
+                    rows = cursor.fetchall()
+                    columns = [description[0] for description in cursor.description]
+                    table_schemas[table_name] = pd.DataFrame(rows, columns=columns)
 
                 return table_schemas
             finally:
                 conn.close()
 
+    def _get_table_columns(self, db_path: Path) -> dict[str, list[tuple[str, str]]]:
+        """Get (column name, column type) pairs for all tables in SQLite or DuckDB database.
+
+        Args:
+            db_path: Path to the database
+
+        Returns:
+            Dictionary mapping table names to their (name, type) column pairs
+        """
+        if self.use_duckdb:
+            with DuckDBLoader(db_path) as loader:
+                return _duckdb_table_columns(loader.connection)
+
+        conn = _open_sqlite_readonly(db_path)
+        try:
+            return self._get_table_info_conn(conn)
+        finally:
+            conn.close()
+
+    def _get_table_info_conn(self, conn: sqlite3.Connection) -> dict[str, list[tuple[str, str]]]:
+        """Get (column name, column type) pairs for all tables over an open SQLite connection.
+
+        Args:
+            conn: Open connection to the database
+
+        Returns:
+            Dictionary mapping table names to their (name, type) column pairs
+        """
+        cursor = conn.cursor()
+        table_columns = {}
+        for table_name in self._sqlite_table_names(cursor):
+            cursor.execute(f'PRAGMA table_info("{table_name}")')
+            table_columns[table_name] = [(row[1], row[2]) for row in cursor.fetchall()]
+        return table_columns
+
+    def _get_row_counts_conn(self, conn: sqlite3.Connection) -> dict[str, int]:
+        """Get row counts for all tables over an open SQLite connection.
+
+        Args:
+            conn: Open connection to the database
+
+        Returns:
+            Dictionary mapping table names to their row counts
+        """
+        cursor = conn.cursor()
+        return _count_rows(cursor, self._sqlite_table_names(cursor))
+
+    @staticmethod
+    def _sqlite_table_names(cursor: sqlite3.Cursor) -> list[str]:
+        """List tables in a SQLite database, ordered by name.
+
+        Args:
+            cursor: Cursor on the database
+
+        Returns:
+            List of table names
+        """
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+        return [row[0] for row in cursor.fetchall()]
+
     def get_row_counts(self, db_path: Path) -> dict[str, int]:
         """Get row counts for all tables in SQLite or DuckDB database.
 
@@ -130,37 +494,33 @@ class YAMLComparator:
         """
         if self.use_duckdb:
             # Use DuckDB
-            loader = DuckDBLoader(db_path)
-            loader.connect()
-            try:
-                table_names = loader.list_tables()
-                row_counts = {}
-                for table_name in table_names:
-                    count_result = loader.query(f'SELECT COUNT(*) as count FROM "{table_name}"')
-                    row_counts[table_name] = int(count_result["count"].iloc[0])
-                return row_counts
-            finally:
-                loader.disconnect()
+            with DuckDBLoader(db_path) as loader:
+                return _count_rows(loader.connection, loader.list_tables())
         else:
             # Use SQLite
-            conn = sqlite3.connect(db_path)
+            conn = _open_sqlite_readonly(db_path)
             try:
-                # Get list of tables
-                tables_query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-                tables_df = pd.read_sql_query(tables_query, conn)
-                table_names = tables_df["name"].tolist()
-
-                # Get row count for each table
-                row_counts = {}
-                for table_name in table_names:
-                    count_query = f'SELECT COUNT(*) as count FROM "{table_name}"'
-                    count_df = pd.read_sql_query(count_query, conn)
-                    row_counts[table_name] = int(count_df["count"].iloc[0])
-
-                return row_counts
+                return self._get_row_counts_conn(conn)
             finally:
                 conn.close()
 
+    def _get_database_metadata(self, db_path: Path) -> tuple[dict[str, list[tuple[str, str]]], dict[str, int]]:
+        """Get column pairs and row counts for all tables in a database.
+
+        Args:
+            db_path: Path to the database
+
+        Returns:
+            Tuple of (table name -> (name, type) column pairs, table name -> row count)
+        """
+        # One connection for all metadata queries
+        if self.use_duckdb:
+            with DuckDBLoader(db_path) as loader:
+                return _duckdb_table_columns(loader.connection), _count_rows(loader.connection, loader.list_tables())
+
+        with closing(_open_sqlite_readonly(db_path)) as conn:
+            return self._get_table_info_conn(conn), self._get_row_counts_conn(conn)
+
     def compare_databases(self, db1_path: Path, db2_path: Path) -> dict:
         """Compare two databases (SQLite or DuckDB).
 
@@ -173,56 +533,18 @@ class YAMLComparator:
         """
         log.info(f"Comparing {db1_path.name} with {db2_path.name}")
 
-        # Get table information
-        db1_schemas = self.get_table_info(db1_path)
-        db2_schemas = self.get_table_info(db2_path)
-
-        db1_tables = set(db1_schemas.keys())
-        db2_tables = set(db2_schemas.keys())
-
-        # Get row counts
-        db1_counts = self.get_row_counts(db1_path)
-        db2_counts = self.get_row_counts(db2_path)
-
-        comparison = {
-            "db1_name": db1_path.stem,
-            "db2_name": db2_path.stem,
-            "tables_only_in_db1": sorted(db1_tables - db2_tables),
-            "tables_only_in_db2": sorted(db2_tables - db1_tables),
-            "common_tables": sorted(db1_tables & db2_tables),
-            "schema_differences": {},
-            "row_count_differences": {},
-        }
-
-        # Compare schemas for common tables
-        for table_name in comparison["common_tables"]:
-            schema1 = db1_schemas[table_name]
-            schema2 = db2_schemas[table_name]
-
-            # Compare column names and types
-            schema1_cols = set(zip(schema1["name"].tolist(), schema1["type"].tolist(), strict=True))
-            schema2_cols = set(zip(schema2["name"].tolist(), schema2["type"].tolist(), strict=True))
-
-            cols_only_in_1 = schema1_cols - schema2_cols
-            cols_only_in_2 = schema2_cols - schema1_cols
-
-            if cols_only_in_1 or cols_only_in_2:
-                comparison["schema_differences"][table_name] = {
-                    "columns_only_in_db1": sorted(cols_only_in_1),
-                    "columns_only_in_db2": sorted(cols_only_in_2),
-                }
-
-            # Compare row counts
-            count1 = db1_counts[table_name]
-            count2 = db2_counts[table_name]
-            if count1 != count2:
-                comparison["row_count_differences"][table_name] = {
-                    "db1_count": count1,
-                    "db2_count": count2,
-                    "difference": count2 - count1,
-                }
+        # Get (column name, column type) pairs and row counts per table, reading both
+        # databases concurrently (each worker uses its own connection)
+        if Path(db1_path).resolve() == Path(db2_path).resolve():
+            # Same file: read it once (DuckDB cannot attach one file twice concurrently)
+            db1_schemas, db1_counts = db2_schemas, db2_counts = self._get_database_metadata(db1_path)
+        else:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                (db1_schemas, db1_counts), (db2_schemas, db2_counts) = executor.map(
+                    self._get_database_metadata, (db1_path, db2_path)
+                )
 
-        return comparison
+        return _compare_metadata(db1_path.stem, db2_path.stem, db1_schemas, db1_counts, db2_schemas, db2_counts)
 
     def generate_report(self, comparison: dict, output_path: Path | None = None) -> str:
         """Generate a markdown report from comparison results.
@@ -234,64 +556,72 @@ class YAMLComparator:
         Returns:
             Markdown formatted report as a string
         """
-        lines = []
-        lines.append("# YAML Comparison Report")
-        lines.append("")
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **File 1:** {comparison['db1_name']}")
-        lines.append(f"- **File 2:** {comparison['db2_name']}")
-        lines.append(f"- **Tables in common:** {len(comparison['common_tables'])}")
-        lines.append(f"- **Tables only in File 1:** {len(comparison['tables_only_in_db1'])}")
-        lines.append(f"- **Tables only in File 2:** {len(comparison['tables_only_in_db2'])}")
-        lines.append(f"- **Schema differences:** {len(comparison['schema_differences'])}")
-        lines.append(f"- **Row count differences:** {len(comparison['row_count_differences'])}")
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+
+        w(
+            "# YAML Comparison Report\n"
+            "\n"
+            "## Summary\n"
+            "\n"
+            f"- **File 1:** {comparison['db1_name']}\n"
+            f"- **File 2:** {comparison['db2_name']}\n"
+            f"- **Tables in common:** {len(comparison['common_tables'])}\n"
+            f"- **Tables only in File 1:** {len(comparison['tables_only_in_db1'])}\n"
+            f"- **Tables only in File 2:** {len(comparison['tables_only_in_db2'])}\n"
+            f"- **Schema differences:** {len(comparison['schema_differences'])}\n"
+            f"- **Row count differences:** {len(comparison['row_count_differences'])}\n"
+            "\n"
+        )
 
         # Tables only in DB1
         if comparison["tables_only_in_db1"]:
-            lines.append("## Tables Only in File 1")
-            lines.append("")
+            w("## Tables Only in File 1\n\n")
             for table in comparison["tables_only_in_db1"]:
-                lines.append(f"- `{table}`")
-            lines.append("")
+                w(f"- `{table}`\n")
+            w("\n")
 
         # Tables only in DB2
         if comparison["tables_only_in_db2"]:
-            lines.append("## Tables Only in File 2")
-            lines.append("")
+            w("## Tables Only in File 2\n\n")
             for table in comparison["tables_only_in_db2"]:
-                lines.append(f"- `{table}`")
-            lines.append("")
+                w(f"- `{table}`\n")
+            w("\n")
 
         # Schema differences
         if comparison["schema_differences"]:
-            lines.append("## Schema Differences")
-            lines.append("")
+            w("## Schema Differences\n\n")
             for table, diffs in comparison["schema_differences"].items():
-                lines.append(f"### Table: `{table}`")
-                lines.append("")
+                w(f"### Table: `{table}`\n\n")
                 if diffs["columns_only_in_db1"]:
-                    lines.append("**Columns only in File 1:**")
+                    w("**Columns only in File 1:**\n")
                     for col_name, col_type in diffs["columns_only_in_db1"]:
-                        lines.append(f"- `{col_name}` ({col_type})")
-                    lines.append("")
+                        w(f"- `{col_name}` ({col_type})\n")
+                    w("\n")
                 if diffs["columns_only_in_db2"]:
-                    lines.append("**Columns only in File 2:**")
+                    w("**Columns only in File 2:**\n")
                     for col_name, col_type in diffs["columns_only_in_db2"]:
-                        lines.append(f"- `{col_name}` ({col_type})")
-                    lines.append("")
+                        w(f"- `{col_name}` ({col_type})\n")
+                    w("\n")
+                # Comparisons built before type mismatches were reported have no such key
+                if diffs.get("type_mismatches"):
+                    w("**Columns with different types:**\n")
+                    for col_name, col_type1, col_type2 in diffs["type_mismatches"]:
+                        w(f"- `{col_name}` ({col_type1} in File 1, {col_type2} in File 2)\n")
+                    w("\n")
 
         # Row count differences
         if comparison["row_count_differences"]:
-            lines.append("## Row Count Differences")
-            lines.append("")
-            lines.append("| Table | File 1 Count | File 2 Count | Difference |")
-            lines.append("|-------|--------------|--------------|------------|")
+            w(
+                "## Row Count Differences\n"
+                "\n"
+                "| Table | File 1 Count | File 2 Count | Difference |\n"
+                "|-------|--------------|--------------|------------|\n"
+            )
             for table, counts in comparison["row_count_differences"].items():
                 diff_str = f"+{counts['difference']}" if counts["difference"] > 0 else str(counts["difference"])
-                lines.append(f"| `{table}` | {counts['db1_count']} | {counts['db2_count']} | {diff_str} |")
-            lines.append("")
+                w(f"| `{table}` | {counts['db1_count']} | {counts['db2_count']} | {diff_str} |\n")
+            w("\n")
 
         # Common tables with no differences
         tables_with_no_diffs = [
@@ -300,20 +630,19 @@ class YAMLComparator:
             if t not in comparison["schema_differences"] and t not in comparison["row_count_differences"]
         ]
         if tables_with_no_diffs:
-            lines.append("## Tables with No Differences")
-            lines.append("")
+            w("## Tables with No Differences\n\n")
             for table in tables_with_no_diffs:
-                lines.append(f"- `{table}`")
-            lines.append("")
+                w(f"- `{table}`\n")
+            w("\n")
 
-        report = "\n".join(lines)
+        # Every line was written with a trailing newline; drop the last one so the
+        # report ends exactly as the previous line-join output did
+        report = buf.getvalue()[:-1]
 
         # Save to file if output path provided
         if output_path:
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(report)
+            _write_report(output_path, report)
             log.info(f"Report saved to {output_path}")
 
         return report
@@ -326,6 +655,10 @@ class YAMLComparator:
         keep_dbs: bool = False,
         root_table_name: str = "root",
         max_depth: int | None = None,
+        data1: Any = None,
+        data2: Any = None,
+        tables1: dict[str, pd.DataFrame] | None = None,
+        tables2: dict[str, pd.DataFrame] | None = None,
     ) -> str:
         """Complete workflow: load two YAML files, compare, and generate report.
 
@@ -336,15 +669,25 @@ class YAMLComparator:
             keep_dbs: Whether to keep the temporary SQLite databases
             root_table_name: Name for the root table in both databases
             max_depth: Maximum depth for flattening nested dictionaries
+            data1: Already parsed contents of the first YAML file
+            data2: Already parsed contents of the second YAML file
+            tables1: Tables already generated from the first YAML file
+            tables2: Tables already generated from the second YAML file
 
         Returns:
             Markdown formatted comparison report
         """
         log.info(f"Comparing {yaml1_path.name} with {yaml2_path.name}")
 
+        # Parsing and flattening hold the GIL, so large inputs may be handled in worker processes
+        if tables1 is None and tables2 is None:
+            tables1, tables2 = _generate_table_pair(
+                yaml1_path, yaml2_path, data1, data2, root_table_name, max_depth, self.parallel
+            )
+
         # Load YAML files into databases
-        db1_path = self.load_yaml_to_db(yaml1_path, root_table_name=root_table_name, max_depth=max_depth)
-        db2_path = self.load_yaml_to_db(yaml2_path, root_table_name=root_table_name, max_depth=max_depth)
+        db1_path = self.load_yaml_to_db(yaml1_path, root_table_name, max_depth, data=data1, tables=tables1)
+        db2_path = self.load_yaml_to_db(yaml2_path, root_table_name, max_depth, data=data2, tables=tables2)
 
         # Compare databases
         comparison = self.compare_databases(db1_path, db2_path)
@@ -368,6 +711,10 @@ class YAMLComparator:
         root_table_name: str = "root",
         max_depth: int | None = None,
         primary_keys: dict[str, list[str]] | None = None,
+        data1: Any = None,
+        data2: Any = None,
+        tables1: dict[str, pd.DataFrame] | None = None,
+        tables2: dict[str, pd.DataFrame] | None = None,
     ) -> dict:
         """Full data comparison workflow: analyze, match tables, and compare data.
 
@@ -381,6 +728,10 @@ class YAMLComparator:
             root_table_name: Name for the root table in both datasets
             max_depth: Maximum depth for flattening nested dictionaries
             primary_keys: Optional dict of table_name -> primary_key columns for explicit PK specification
+            data1: Already parsed contents of the first YAML file
+            data2: Already parsed contents of the second YAML file
+            tables1: Tables already generated from the first YAML file
+            tables2: Tables already generated from the second YAML file
 
         Returns:
             Dictionary containing full data comparison results
@@ -390,18 +741,10 @@ class YAMLComparator:
 
         log.info(f"Performing full data comparison: {yaml1_path.name} vs {yaml2_path.name}")
 
-        # Load YAML data
-        with open(yaml1_path) as f:
-            data1 = yaml.safe_load(f)
-        with open(yaml2_path) as f:
-            data2 = yaml.safe_load(f)
-
-        # Generate tables from both YAML files
-        table_gen1 = TableGenerator(max_depth=max_depth)
-        tables1 = table_gen1.generate_tables(data1, root_table_name=root_table_name, source_file=yaml1_path)
-
-        table_gen2 = TableGenerator(max_depth=max_depth)
-        tables2 = table_gen2.generate_tables(data2, root_table_name=root_table_name, source_file=yaml2_path)
+        if tables1 is None or tables2 is None:
+            tables1, tables2 = _generate_table_pair(
+                yaml1_path, yaml2_path, data1, data2, root_table_name, max_depth, self.parallel
+            )
 
         log.info(f"Generated {len(tables1)} tables from {yaml1_path.name}")
         log.info(f"Generated {len(tables2)} tables from {yaml2_path.name}")
@@ -422,9 +765,7 @@ class YAMLComparator:
         if output_report:
             report = comparer.generate_comparison_report(comparison)
             output_path = Path(output_report)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(report)
+            _write_report(output_path, report)
             log.info(f"Data comparison report saved to {output_path}")
 
         return comparison
@@ -456,6 +797,11 @@ class YAMLComparator:
         Returns:
             Tuple of (schema_report_markdown, data_comparison_dict)
         """
+        # Parse and flatten each file once; both comparisons reuse the generated tables
+        tables1, tables2 = _generate_table_pair(
+            yaml1_path, yaml2_path, None, None, root_table_name, max_depth, self.parallel
+        )
+
         # Run schema comparison (existing)
         schema_report = self.compare_yaml_files(
             yaml1_path=yaml1_path,
@@ -464,28 +810,33 @@ class YAMLComparator:
             keep_dbs=keep_dbs,
             root_table_name=root_table_name,
             max_depth=max_depth,
+            tables1=tables1,
+            tables2=tables2,
         )
 
-        # Run data comparison (new)
-        output_path = Path(output_report) if output_report else None
-        data_output = output_path.with_suffix(".data.md") if output_path else None
+        # Run data comparison (new). The data report is generated once below and used for
+        # both the standalone data report and the combined report.
         data_comparison = self.compare_data(
             yaml1_path=yaml1_path,
             yaml2_path=yaml2_path,
-            output_report=data_output,
+            output_report=None,
             root_table_name=root_table_name,
             max_depth=max_depth,
             primary_keys=primary_keys,
+            tables1=tables1,
+            tables2=tables2,
         )
 
-        # Save combined report if requested
-        if output_path:
-            comparer = DataComparer()
-            data_report = comparer.generate_comparison_report(data_comparison)
+        # Save data and combined reports if requested
+        if output_report:
+            output_path = Path(output_report)
+            data_report = DataComparer().generate_comparison_report(data_comparison)
+
+            data_output = output_path.with_suffix(".data.md")
+            _write_report(data_output, data_report)
+            log.info(f"Data comparison report saved to {data_output}")
 
-            combined_report = schema_report + "\n\n---\n\n" + data_report
-            with open(output_path, "w") as f:
-                f.write(combined_report)
+            _write_report(output_path, schema_report + "\n\n---\n\n" + data_report)
             log.info(f"Combined comparison report saved to {output_path}")
 
         return schema_report, data_comparison
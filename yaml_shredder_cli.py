@@ -2,16 +2,89 @@
 """CLI for YAML Shredder - analyze YAML/JSON and convert to relational tables."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
-import yaml
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib json module
+    orjson = None
 
-from yaml_shredder.data_loader import SQLiteLoader
-from yaml_shredder.ddl_generator import DDLGenerator
-from yaml_shredder.schema_generator import SchemaGenerator
-from yaml_shredder.structure_analyzer import StructureAnalyzer
-from yaml_shredder.table_generator import TableGenerator
+# Separator line framing the section headers of the "all" workflow
+_BAR = "=" * 70
+
+# Number of "Adding: <file>" lines written at once by `schema --verbose`
+_LISTING_BATCH_SIZE = 1024
+
+# yaml and the yaml_shredder modules (which pull in pandas) are imported inside the
+# commands that use them, so that --help and argument errors return quickly
+
+
+def _load_json(raw: bytes):
+    """Parse JSON from raw bytes.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers wider than 64 bits; json accepts them
+            pass
+
+    import json
+
+    return json.loads(raw)
+
+
+def _load_yaml(raw: bytes):
+    """Parse YAML from raw bytes.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Parsed YAML data
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    return yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _sniff_load(raw: bytes):
+    """Parse raw bytes of unknown format as JSON or YAML.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Parsed data
+    """
+    import yaml
+
+    if raw.lstrip()[:1] in (b"{", b"["):
+        # Looks like JSON: JSON is also valid YAML, but the JSON parser is much faster
+        try:
+            return _load_json(raw)
+        except ValueError:
+            return _load_yaml(raw)
+
+    # Try YAML first, then JSON
+    try:
+        return _load_yaml(raw)
+    except yaml.YAMLError:
+        return _load_json(raw)
+
+
+# File suffix -> parser; files with any other suffix are sniffed
+_LOADERS = {".yaml": _load_yaml, ".yml": _load_yaml, ".json": _load_json}
 
 
 def load_yaml_or_json(file_path: Path) -> dict:
@@ -26,21 +99,10 @@ def load_yaml_or_json(file_path: Path) -> dict:
     Raises:
         ValueError: If the file is empty or root element is not a dictionary
     """
-    import json
+    with open(file_path, "rb") as f:
+        raw = f.read()
 
-    with open(file_path) as f:
-        if file_path.suffix.lower() in [".yaml", ".yml"]:
-            data = yaml.safe_load(f)
-        elif file_path.suffix.lower() == ".json":
-            data = json.load(f)
-        else:
-            # Try YAML first, then JSON
-            try:
-                f.seek(0)
-                data = yaml.safe_load(f)
-            except yaml.YAMLError:
-                f.seek(0)
-                data = json.load(f)
+    data = _LOADERS.get(file_path.suffix.lower(), _sniff_load)(raw)
 
     # Validate that we have a dictionary
     if data is None:
@@ -56,6 +118,8 @@ def load_yaml_or_json(file_path: Path) -> dict:
 
 def cmd_analyze(args):
     """Analyze YAML/JSON structure."""
+    from yaml_shredder.structure_analyzer import StructureAnalyzer
+
     print(f"Analyzing: {args.input}")
     data = load_yaml_or_json(args.input)
 
@@ -64,30 +128,46 @@ def cmd_analyze(args):
     analyzer.print_summary(analysis)
 
     if args.output:
-        import json
+        # JSON object keys must be strings, but structure signatures are tuples of keys
+        patterns = {str(signature): paths for signature, paths in analysis["structure_patterns"].items()}
+        analysis = {**analysis, "structure_patterns": patterns}
+
+        if orjson is not None:
+            with open(args.output, "wb") as f:
+                f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+        else:
+            import json
 
-        with open(args.output, "w") as f:
-            json.dump(analysis, f, indent=2)
+            with open(args.output, "w") as f:
+                json.dump(analysis, f, indent=2)
         print(f"\n✓ Analysis saved to: {args.output}")
 
 
 def cmd_schema(args):
     """Generate JSON schema."""
+    from yaml_shredder.schema_generator import SchemaGenerator
+
     print(f"Generating schema from: {args.input}")
 
     generator = SchemaGenerator()
 
     if args.input.is_dir():
-        # Process directory
-        for file in args.input.glob("**/*.yaml"):
-            print(f"  Adding: {file}")
-            generator.add_yaml_file(file)
-        for file in args.input.glob("**/*.yml"):
-            print(f"  Adding: {file}")
-            generator.add_yaml_file(file)
-        for file in args.input.glob("**/*.json"):
-            print(f"  Adding: {file}")
-            generator.add_json_file(file)
+        # Process directory: find files in a single walk, then add .yaml, .yml and .json files in that order
+        found = {".yaml": [], ".yml": [], ".json": []}
+        for root, _dirs, names in os.walk(args.input):
+            for name in names:
+                files = found.get(os.path.splitext(name)[1])
+                if files is not None:
+                    files.append(Path(root) / name)
+        files = found[".yaml"] + found[".yml"] + found[".json"]
+        for start in range(0, len(files), _LISTING_BATCH_SIZE):
+            batch = files[start : start + _LISTING_BATCH_SIZE]
+            if args.verbose:
+                # One write per batch rather than one print per file
+                sys.stdout.write("".join(f"  Adding: {file}\n" for file in batch))
+                sys.stdout.flush()
+            generator.add_files(batch, parallel=True)
+        print(f"  Added {len(files)} files")
     else:
         # Single file
         if args.input.suffix.lower() == ".json":
@@ -105,13 +185,22 @@ def cmd_schema(args):
     if args.output:
         generator.save_schema(args.output)
     else:
-        import json
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if orjson is not None and stdout_buffer is not None:
+            # Write the encoded bytes directly; flush pending text first to keep the output in order
+            sys.stdout.flush()
+            stdout_buffer.write(b"\n" + orjson.dumps(schema, option=orjson.OPT_INDENT_2) + b"\n")
+            stdout_buffer.flush()
+        else:
+            import json
 
-        print(f"\n{json.dumps(schema, indent=2)}")
+            print(f"\n{json.dumps(schema, indent=2)}")
 
 
 def cmd_tables(args):
     """Generate relational tables."""
+    from yaml_shredder.table_generator import TableGenerator
+
     print(f"Generating tables from: {args.input}")
     data = load_yaml_or_json(args.input)
 
@@ -132,6 +221,9 @@ def cmd_tables(args):
 
 def cmd_ddl(args):
     """Generate SQL DDL."""
+    from yaml_shredder.ddl_generator import DDLGenerator
+    from yaml_shredder.table_generator import TableGenerator
+
     print(f"Generating DDL from: {args.input}")
     data = load_yaml_or_json(args.input)
 
@@ -151,6 +243,10 @@ def cmd_ddl(args):
 
 def cmd_load(args):
     """Load tables into SQLite database."""
+    from yaml_shredder.data_loader import SQLiteLoader
+    from yaml_shredder.ddl_generator import DDLGenerator
+    from yaml_shredder.table_generator import TableGenerator
+
     print(f"Loading data from: {args.input}")
     data = load_yaml_or_json(args.input)
 
@@ -178,32 +274,39 @@ def cmd_load(args):
     loader.disconnect()
 
 
+def _header(title: str) -> None:
+    """Print a workflow section header framed by separator lines.
+
+    Args:
+        title: Section title
+    """
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
+
+
 def cmd_all(args):
     """Run complete workflow: analyze, schema, tables, DDL, and load."""
-    print("=" * 70)
-    print("YAML SHREDDER - COMPLETE WORKFLOW")
-    print("=" * 70)
+    from yaml_shredder.data_loader import SQLiteLoader
+    from yaml_shredder.ddl_generator import DDLGenerator
+    from yaml_shredder.schema_generator import SchemaGenerator
+    from yaml_shredder.structure_analyzer import StructureAnalyzer
+    from yaml_shredder.table_generator import TableGenerator
+
+    print(f"{_BAR}\nYAML SHREDDER - COMPLETE WORKFLOW\n{_BAR}")
     print(f"\nInput: {args.input}")
 
     data = load_yaml_or_json(args.input)
 
     # Step 1: Analyze
-    print(f"\n{'=' * 70}")
-    print("STEP 1: STRUCTURE ANALYSIS")
-    print(f"{'=' * 70}")
+    _header("STEP 1: STRUCTURE ANALYSIS")
     analyzer = StructureAnalyzer()
     analysis = analyzer.analyze(data)
     analyzer.print_summary(analysis)
 
     # Step 2: Schema
-    print(f"\n{'=' * 70}")
-    print("STEP 2: SCHEMA GENERATION")
-    print(f"{'=' * 70}")
+    _header("STEP 2: SCHEMA GENERATION")
     generator = SchemaGenerator()
-    if args.input.suffix.lower() == ".json":
-        generator.add_json_file(args.input)
-    else:
-        generator.add_yaml_file(args.input)
+    # Reuse the data parsed above instead of reading the input file again
+    generator.add_object(data, source=args.input)
     generator.generate_schema()
     stats = generator.get_stats()
     print(f"\n✓ Schema: {stats['schema_properties']} properties, {stats['required_fields']} required")
@@ -212,9 +315,7 @@ def cmd_all(args):
         generator.save_schema(args.schema_output)
 
     # Step 3: Tables
-    print(f"\n{'=' * 70}")
-    print("STEP 3: TABLE GENERATION")
-    print(f"{'=' * 70}")
+    _header("STEP 3: TABLE GENERATION")
     table_gen = TableGenerator()
     tables = table_gen.generate_tables(data, root_table_name=args.root_name)
     table_gen.print_summary()
@@ -223,9 +324,7 @@ def cmd_all(args):
         table_gen.save_tables(args.tables_output, format=args.format)
 
     # Step 4: DDL
-    print(f"\n{'=' * 70}")
-    print("STEP 4: DDL GENERATION")
-    print(f"{'=' * 70}")
+    _header("STEP 4: DDL GENERATION")
     ddl_gen = DDLGenerator(dialect=args.dialect)
     ddl_statements = ddl_gen.generate_ddl(tables, table_gen.relationships)
 
@@ -236,18 +335,14 @@ def cmd_all(args):
 
     # Step 5: Load
     if args.database:
-        print(f"\n{'=' * 70}")
-        print("STEP 5: DATABASE LOAD")
-        print(f"{'=' * 70}")
+        _header("STEP 5: DATABASE LOAD")
         loader = SQLiteLoader(args.database)
         loader.connect()
         loader.load_tables(tables, if_exists=args.if_exists, create_indexes=True)
         loader.print_summary()
         loader.disconnect()
 
-    print(f"\n{'=' * 70}")
-    print("✓ WORKFLOW COMPLETE")
-    print(f"{'=' * 70}")
+    _header("✓ WORKFLOW COMPLETE")
 
 
 def main():
@@ -269,6 +364,7 @@ def main():
     parser_schema = subparsers.add_parser("schema", help="Generate JSON schema")
     parser_schema.add_argument("input", type=Path, help="Input YAML/JSON file or directory")
     parser_schema.add_argument("-o", "--output", type=Path, help="Output JSON schema file")
+    parser_schema.add_argument("-v", "--verbose", action="store_true", help="List each file added from a directory")
     parser_schema.set_defaults(func=cmd_schema)
 
     # Tables command